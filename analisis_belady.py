@@ -0,0 +1,54 @@
+# analisis_belady.py
+# Skrip ini mencari Anomali Belady secara otomatis (bukan hanya satu kasus pilihan tangan)
+# dan memvisualisasikan counterexample minimal serta distribusi besaran anomali.
+# Pencarian dijalankan paralel di semua core CPU (multiprocessing).
+
+import matplotlib.pyplot as plt
+
+from core.belady import search_anomalies
+from core.fault_curves import fifo_fault_curve
+
+# Parameter pencarian
+JUMLAH_KANDIDAT = 1_000_000   # Jumlah string referensi yang diuji
+PANJANG_STRING = 20           # Panjang setiap string referensi
+JUMLAH_HALAMAN = 5            # Jumlah halaman berbeda
+MODE = "random"               # "random" atau "cyclic" (turunan pola Test Case 4, jauh lebih banyak anomali)
+SEED = 2025
+
+if __name__ == "__main__":
+    hasil = search_anomalies(JUMLAH_KANDIDAT, PANJANG_STRING, JUMLAH_HALAMAN, mode=MODE, seed=SEED)
+
+    print(f"Diuji: {hasil['tested']} string, anomali: {hasil['anomalous']} ({hasil['anomaly_rate']:.4f}%)")
+    print(f"Besaran anomali (selisih fault: jumlah): {hasil['magnitudes']}")
+    print(f"Jumlah frame saat anomali (m -> m+1: jumlah): {hasil['frames']}")
+
+    minimal = hasil["minimal"]
+    if minimal is None:
+        print("Tidak ditemukan anomali. Coba tambah JUMLAH_KANDIDAT atau PANJANG_STRING.")
+    else:
+        print(f"Counterexample minimal: {','.join(str(p) for p in minimal['references'])}")
+        print(f"  {minimal['frames']} frame -> {minimal['faults']} fault, "
+              f"{minimal['frames'] + 1} frame -> {minimal['faults_more_frames']} fault")
+
+        # --- GRAFIK 1: Kurva FIFO counterexample minimal ---
+        kurva = fifo_fault_curve(minimal["references"])
+        frames = list(range(1, len(kurva) + 1))
+        fig, (ax_kurva, ax_besaran) = plt.subplots(1, 2, figsize=(16, 6))
+        ax_kurva.plot(frames, kurva, marker='o', linestyle='-', color='#E76F51', label='FIFO', linewidth=2, markersize=8)
+        ax_kurva.set_title('Kurva FIFO Counterexample Minimal', fontsize=16)
+        ax_kurva.set_xlabel('Jumlah Frame Fisik', fontsize=12)
+        ax_kurva.set_ylabel('Total Page Faults', fontsize=12)
+        ax_kurva.set_xticks(frames)
+        ax_kurva.grid(True, which='both', linestyle=':', linewidth=0.7)
+        ax_kurva.legend(fontsize=12)
+
+        # --- GRAFIK 2: Distribusi besaran anomali ---
+        besaran = list(hasil["magnitudes"].keys())
+        jumlah = list(hasil["magnitudes"].values())
+        ax_besaran.bar([str(b) for b in besaran], jumlah, color='#3A7EBF')
+        ax_besaran.set_title(f'Distribusi Besaran Anomali\n({hasil["tested"]} string, mode {MODE})', fontsize=16)
+        ax_besaran.set_xlabel('Kenaikan Page Fault saat Frame Ditambah', fontsize=12)
+        ax_besaran.set_ylabel('Jumlah Kejadian', fontsize=12)
+
+        plt.savefig('grafik_pencarian_belady.png', dpi=300, bbox_inches='tight')
+        print("Grafik 'grafik_pencarian_belady.png' berhasil disimpan.")
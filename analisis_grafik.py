@@ -6,6 +6,11 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+from core.memory_manager import PhysicalMemory, MemoryManagementUnit
+from core.replacement_algorithms import FIFO, LRU
+from core.workloads import generate, run_trace
+from core.page_size_analysis import page_size_sweep, heatmap
+
 # --- GRAFIK 1: Analisis Anomali Belady & Perbandingan Kinerja ---
 # TUJUAN: Menunjukkan bagaimana jumlah page fault berubah saat jumlah frame ditambah.
 # DATA DARI: Tabel hasil untuk "Test Case 5: Anomali Belady & Pola Siklis".
@@ -67,5 +72,73 @@ for bar in bars:
 plt.savefig('grafik_lokalitas.png', dpi=300, bbox_inches='tight')
 print("Grafik 'grafik_lokalitas.png' berhasil disimpan.")
 
-# Untuk menampilkan kedua grafik di layar setelah dijalankan (opsional, hapus tanda #)
+# --- GRAFIK 3: Page Faults vs. Jumlah Frame pada Beban Kerja Sintetis ---
+# TUJUAN: Membandingkan FIFO dan LRU pada string referensi yang lebih panjang dari contoh manual.
+# DATA DARI: Generator core/workloads.py (seed tetap sehingga reproducible), dijalankan langsung pada MMU.
+
+PAGE_SIZE = 4096
+JUMLAH_REFERENSI = 20000
+frames_sintetis = list(range(2, 17, 2))
+beban_kerja = {
+    "Zipf (alpha=1.1)": generate("zipf", JUMLAH_REFERENSI, seed=42, num_pages=256, alpha=1.1),
+    "Loop 12 halaman + noise": generate("loop", JUMLAH_REFERENSI, seed=42, loop_pages=12, num_pages=256, noise=0.05),
+    "Lokalitas berfase": generate("phased", JUMLAH_REFERENSI, seed=42, num_pages=256, working_set=8, phase_length=2000),
+}
+
+def hitung_faults(algorithm_class, referensi, num_frames):
+    """Menjalankan referensi pada MMU baru dan mengembalikan jumlah page fault"""
+    mmu = MemoryManagementUnit(PhysicalMemory(num_frames, PAGE_SIZE), algorithm_class(num_frames))
+    pid = mmu.create_process(int(referensi.max() + 1) * PAGE_SIZE, PAGE_SIZE)
+    return run_trace(mmu, pid, referensi)["faults"]
+
+fig, axes = plt.subplots(1, len(beban_kerja), figsize=(18, 5))
+for ax, (nama, referensi) in zip(axes, beban_kerja.items()):
+    ax.plot(frames_sintetis, [hitung_faults(FIFO, referensi, f) for f in frames_sintetis], marker='o', linestyle='-', color='#E76F51', label='FIFO', linewidth=2)
+    ax.plot(frames_sintetis, [hitung_faults(LRU, referensi, f) for f in frames_sintetis], marker='s', linestyle='--', color='#2A9D8F', label='LRU', linewidth=2)
+    ax.set_title(nama, fontsize=14)
+    ax.set_xlabel('Jumlah Frame Fisik', fontsize=12)
+    ax.set_ylabel('Total Page Faults', fontsize=12)
+    ax.grid(True, which='both', linestyle=':', linewidth=0.7)
+    ax.legend(fontsize=11)
+
+fig.suptitle(f'Page Faults vs. Jumlah Frame pada Beban Kerja Sintetis ({JUMLAH_REFERENSI} referensi)', fontsize=16)
+plt.savefig('grafik_beban_sintetis.png', dpi=300, bbox_inches='tight')
+print("Grafik 'grafik_beban_sintetis.png' berhasil disimpan.")
+
+
+# --- GRAFIK 4: Sensitivitas Ukuran Halaman (Heatmap Ukuran Halaman x Jumlah Frame) ---
+# TUJUAN: Padanan Grafik 3 untuk ukuran halaman: halaman besar memanfaatkan lokalitas spasial
+#         tetapi memboroskan frame, halaman kecil sebaliknya.
+# DATA DARI: Satu trace alamat byte sintetis; string halaman untuk semua ukuran diturunkan
+#            sekaligus oleh core/page_size_analysis.py (tanpa menjalankan ulang simulasi).
+
+rng = np.random.default_rng(42)
+JUMLAH_ALAMAT = 200000
+# Campuran objek panas 256 byte (pola Zipf, 512 KB) dan scan array 8 byte mulai alamat 4 MB
+alamat_objek = generate("zipf", JUMLAH_ALAMAT // 2, seed=42, num_pages=2048, alpha=1.1) * 256 + rng.integers(0, 256, JUMLAH_ALAMAT // 2)
+alamat_scan = (4 << 20) + (np.arange(JUMLAH_ALAMAT // 2) * 8) % (1 << 20)
+alamat = np.empty(JUMLAH_ALAMAT, dtype=np.int64)
+alamat[0::2], alamat[1::2] = alamat_objek, alamat_scan
+
+ukuran_halaman = [512 << k for k in range(8)]  # 512 B - 64 KB
+frames_ukuran = list(range(4, 65, 4))
+hasil_ukuran = page_size_sweep(alamat, ukuran_halaman, frames_ukuran)
+
+fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+for ax, algoritma in zip(axes, ["fifo", "lru"]):
+    ukuran, frames_heatmap, fault_rate = heatmap(hasil_ukuran, algoritma)
+    gambar = ax.imshow(fault_rate, aspect='auto', origin='lower', cmap='magma_r')
+    ax.set_xticks(range(len(frames_heatmap)), frames_heatmap)
+    ax.set_yticks(range(len(ukuran)), [f'{u // 1024} KB' if u >= 1024 else f'{u} B' for u in ukuran])
+    ax.set_title(algoritma.upper(), fontsize=14)
+    ax.set_xlabel('Jumlah Frame Fisik', fontsize=12)
+    ax.set_ylabel('Ukuran Halaman', fontsize=12)
+    fig.colorbar(gambar, ax=ax, label='Page Fault Rate (%)')
+
+fig.suptitle(f'Sensitivitas Ukuran Halaman ({JUMLAH_ALAMAT} alamat byte)', fontsize=16)
+plt.savefig('grafik_ukuran_halaman.png', dpi=300, bbox_inches='tight')
+print("Grafik 'grafik_ukuran_halaman.png' berhasil disimpan.")
+
+
+# Untuk menampilkan semua grafik di layar setelah dijalankan (opsional, hapus tanda #)
 # plt.show()
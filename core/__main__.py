@@ -0,0 +1,6 @@
+# core/__main__.py
+"""Titik masuk `python -m core` (lihat core/cli.py)"""
+import sys
+from core.cli import main
+
+sys.exit(main())
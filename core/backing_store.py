@@ -0,0 +1,136 @@
+# core/backing_store.py
+"""
+Modul Backing Store (Swap)
+Mensimulasikan perangkat swap dengan latensi dan bandwidth yang dapat dikonfigurasi,
+serta daemon page-out yang menjaga persediaan frame kosong dengan watermark
+"""
+
+from collections import deque
+
+
+def percentile(values, p):
+    """
+    Menghitung persentil ke-p (0-100) dengan metode nearest-rank
+    Return: nilai persentil, atau 0 jika data kosong
+    """
+    if not values:
+        return 0
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * p // 100))  # ceil(n * p / 100)
+    return ordered[min(int(rank), len(ordered)) - 1]
+
+
+class SwapDevice:
+    """
+    Perangkat swap tersimulasi. Setiap transfer satu halaman memakan waktu
+    latensi + ukuran halaman / bandwidth. Permintaan dilayani berurutan (satu antrian),
+    sehingga penulisan asinkron dapat menunda pembacaan berikutnya.
+    Semua waktu dalam milidetik (ms) waktu simulasi.
+    """
+    def __init__(self, page_size, read_latency_ms=5.0, write_latency_ms=5.0, bandwidth_mb_s=100.0):
+        self.page_size = page_size
+        self.read_latency_ms = read_latency_ms
+        self.write_latency_ms = write_latency_ms
+        self.bandwidth_mb_s = bandwidth_mb_s
+        self.reset()
+
+    def transfer_time(self, latency_ms, pages=1):
+        """Waktu layanan sejumlah halaman kontigu: latensi + waktu transfer"""
+        bytes_per_ms = self.bandwidth_mb_s * 1024 * 1024 / 1000
+        return latency_ms + pages * self.page_size / bytes_per_ms
+
+    def _submit(self, now, latency_ms, pages):
+        """Menjadwalkan satu transfer di antrian perangkat. Return: waktu selesai"""
+        service_time = self.transfer_time(latency_ms, pages)
+        start = max(now, self.busy_until)
+        self.busy_until = start + service_time
+        self.busy_time += service_time
+        return self.busy_until
+
+    def read_page(self, now, pages=1):
+        """Membaca halaman (atau huge page sebesar pages halaman) dari swap. Return: waktu selesai"""
+        self.reads += pages
+        return self._submit(now, self.read_latency_ms, pages)
+
+    def write_page(self, now, pages=1):
+        """Menulis halaman (atau huge page sebesar pages halaman) ke swap. Return: waktu selesai"""
+        self.writes += pages
+        return self._submit(now, self.write_latency_ms, pages)
+
+    def get_stats(self):
+        """Statistik perangkat: jumlah baca/tulis dan total waktu I/O"""
+        return {
+            "swap_reads": self.reads,
+            "swap_writes": self.writes,
+            "io_time_ms": self.busy_time,
+        }
+
+    def reset(self):
+        """Reset antrian dan statistik perangkat"""
+        self.busy_until = 0.0
+        self.busy_time = 0.0
+        self.reads = 0
+        self.writes = 0
+
+
+class PageOutDaemon:
+    """
+    Daemon page-out (mirip kswapd). Dijalankan setelah setiap akses:
+    jika frame kosong kurang dari low_watermark, halaman dikeluarkan sampai
+    frame kosong (termasuk yang sedang ditulis balik) mencapai high_watermark.
+    Halaman dirty ditulis balik secara asinkron; frame-nya baru kembali ke
+    daftar frame kosong setelah penulisan selesai.
+    """
+    def __init__(self, low_watermark, high_watermark):
+        if not 0 <= low_watermark <= high_watermark:
+            raise ValueError("Watermark harus memenuhi 0 <= low <= high.")
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.pending = deque()   # Antrian write-back: (waktu selesai, frame pertama, jumlah frame)
+        self.pending_frames = 0  # Total frame yang sedang ditulis balik
+        self.evictions = 0       # Jumlah unit halaman yang dikeluarkan daemon
+
+    def reap(self, physical_memory, now):
+        """Mengembalikan frame yang write-back-nya sudah selesai pada waktu now"""
+        while self.pending and self.pending[0][0] <= now:
+            _, frame_number, size = self.pending.popleft()
+            self.pending_frames -= size
+            physical_memory.free_frame(frame_number)
+
+    def wait_for_frame(self, physical_memory, now):
+        """
+        Menunggu write-back tertua selesai agar satu frame kosong tersedia
+        Return: waktu setelah menunggu, atau None jika tidak ada write-back tertunda
+        """
+        if not self.pending:
+            return None
+        done, frame_number, size = self.pending.popleft()
+        self.pending_frames -= size
+        physical_memory.free_frame(frame_number)
+        return max(now, done)
+
+    def run(self, mmu, now):
+        """Menyeimbangkan frame kosong terhadap watermark"""
+        physical_memory = mmu.physical_memory
+        self.reap(physical_memory, now)
+        if physical_memory.free_frame_count() + self.pending_frames >= self.low_watermark:
+            return
+
+        while physical_memory.free_frame_count() + self.pending_frames < self.high_watermark:
+            victim_frame_num = mmu.replacement_algorithm.select_victim()
+            if victim_frame_num == -1:
+                break
+            self.evictions += 1
+            size = physical_memory.block_size(victim_frame_num)
+            # Halaman dirty: pemetaan dicabut sekarang, frame dibebaskan setelah write-back
+            if not mmu.evict_unit(victim_frame_num, release=False):
+                continue
+            done = mmu.swap_device.write_page(now, size) if mmu.swap_device else now
+            self.pending.append((done, victim_frame_num, size))
+            self.pending_frames += size
+
+    def reset(self):
+        """Reset antrian write-back dan statistik daemon"""
+        self.pending.clear()
+        self.pending_frames = 0
+        self.evictions = 0
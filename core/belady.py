@@ -0,0 +1,160 @@
+# core/belady.py
+"""
+Pencarian Otomatis Anomali Belady
+Menguji banyak string referensi acak atau terstruktur secara paralel (process pool),
+mencatat contoh anomali FIFO, counterexample minimal, dan statistik besaran anomali
+"""
+
+import random
+from collections import Counter
+from multiprocessing import Pool
+
+from core.fault_curves import BELADY_PATTERN, fifo_fault_curve, find_anomalies
+
+SEARCH_MODES = ("random", "cyclic")
+
+
+def _random_candidate(rng, length, num_pages):
+    """String referensi acak seragam"""
+    return [rng.randrange(num_pages) for _ in range(length)]
+
+def _cyclic_candidate(rng, length, num_pages):
+    """
+    String referensi terstruktur dari keluarga Anomali Belady (Test Case 4):
+    BELADY_PATTERN dengan label halaman acak, diulang selama muat, diberi
+    0-2 mutasi (ganti, sisip, hapus), lalu sisanya diisi referensi acak.
+    Pada length=20 dan 5 halaman sekitar 11% kandidat anomali (acak: <0.1%).
+    """
+    labels = rng.sample(range(num_pages), min(5, num_pages))
+    block = [labels[page % len(labels)] for page in BELADY_PATTERN]
+    references = []
+    while len(references) + len(block) <= length:
+        references.extend(block)
+    if not references:
+        references = block
+    for _ in range(rng.randint(0, 2)):
+        i = rng.randrange(len(references))
+        operation = rng.randrange(3)
+        if operation == 0:
+            references[i] = rng.randrange(num_pages)
+        elif operation == 1:
+            references.insert(i, rng.randrange(num_pages))
+        elif len(references) > 1:
+            del references[i]
+    references.extend(rng.randrange(num_pages) for _ in range(length - len(references)))
+    return references[:length]
+
+_GENERATORS = {"random": _random_candidate, "cyclic": _cyclic_candidate}
+
+
+def _anomaly_key(example):
+    """Urutan 'paling minimal': string terpendek, halaman unik paling sedikit, anomali terbesar"""
+    references, _, faults_m, faults_m1 = example
+    return (len(references), len(set(references)), faults_m - faults_m1)
+
+
+def _search_batch(task):
+    """Worker: menguji satu batch kandidat. Return: ringkasan batch yang bisa digabung"""
+    seed, batch_index, batch_size, length, num_pages, mode, keep = task
+    rng = random.Random(seed * 1_000_003 + batch_index)
+    generator = _GENERATORS[mode]
+    magnitudes = Counter()
+    by_frames = Counter()
+    examples = []
+    anomalous = 0
+    for _ in range(batch_size):
+        references = generator(rng, length, num_pages)
+        anomalies = find_anomalies(fifo_fault_curve(references))
+        if not anomalies:
+            continue
+        anomalous += 1
+        for m, faults_m, faults_m1 in anomalies:
+            magnitudes[faults_m1 - faults_m] += 1
+            by_frames[m] += 1
+        m, faults_m, faults_m1 = max(anomalies, key=lambda a: a[2] - a[1])
+        examples.append((references, m, faults_m, faults_m1))
+    examples.sort(key=_anomaly_key)
+    return batch_size, anomalous, magnitudes, by_frames, examples[:keep]
+
+
+def shrink_counterexample(references, num_frames):
+    """
+    Memperkecil counterexample secara greedy: hapus referensi satu per satu
+    selama anomali antara num_frames dan num_frames + 1 frame tetap ada,
+    lalu beri label ulang halaman menjadi 0, 1, 2, ... sesuai urutan kemunculan
+    """
+    def is_anomalous(refs):
+        curve = fifo_fault_curve(refs, num_frames + 1)
+        return len(curve) > num_frames and curve[num_frames] > curve[num_frames - 1]
+
+    references = list(references)
+    changed = True
+    while changed:
+        changed = False
+        for i in range(len(references)):
+            candidate = references[:i] + references[i + 1:]
+            if is_anomalous(candidate):
+                references = candidate
+                changed = True
+                break
+
+    labels = {}
+    return [labels.setdefault(page, len(labels)) for page in references]
+
+
+def search_anomalies(num_candidates, length=20, num_pages=5, mode="random", seed=0, processes=None, batch_size=20000, keep=10):
+    """
+    Mencari Anomali Belady pada num_candidates string referensi sepanjang length
+    dengan num_pages halaman berbeda, dibagi ke process pool per batch.
+    processes=1 menjalankan pencarian di proses saat ini.
+    Return: dict statistik (jumlah diuji, jumlah anomali, distribusi besaran,
+    distribusi jumlah frame, contoh terkecil, dan counterexample minimal hasil shrink)
+    """
+    if mode not in _GENERATORS:
+        raise ValueError(f"Mode pencarian tidak dikenal: {mode}. Pilihan: {', '.join(SEARCH_MODES)}")
+    if length < 1 or num_pages < 1:
+        raise ValueError("Parameter length dan num_pages harus bilangan positif.")
+
+    tasks = []
+    for batch_index, start in enumerate(range(0, num_candidates, batch_size)):
+        count = min(batch_size, num_candidates - start)
+        tasks.append((seed, batch_index, count, length, num_pages, mode, keep))
+
+    if processes == 1:
+        results = map(_search_batch, tasks)
+        return _merge_results(results, keep)
+    with Pool(processes) as pool:
+        return _merge_results(pool.imap_unordered(_search_batch, tasks), keep)
+
+
+def _merge_results(results, keep):
+    """Menggabungkan ringkasan semua batch menjadi satu laporan"""
+    tested = 0
+    anomalous = 0
+    magnitudes = Counter()
+    by_frames = Counter()
+    examples = []
+    for batch_tested, batch_anomalous, batch_magnitudes, batch_frames, batch_examples in results:
+        tested += batch_tested
+        anomalous += batch_anomalous
+        magnitudes.update(batch_magnitudes)
+        by_frames.update(batch_frames)
+        examples = sorted(examples + batch_examples, key=_anomaly_key)[:keep]
+
+    minimal = None
+    if examples:
+        references, m, _, _ = examples[0]
+        shrunk = shrink_counterexample(references, m)
+        curve = fifo_fault_curve(shrunk, m + 1)
+        minimal = {"references": shrunk, "frames": m, "faults": curve[m - 1], "faults_more_frames": curve[m]}
+
+    return {
+        "tested": tested,
+        "anomalous": anomalous,
+        "anomaly_rate": (anomalous / tested) * 100 if tested else 0,
+        "max_magnitude": max(magnitudes) if magnitudes else 0,
+        "magnitudes": dict(sorted(magnitudes.items())),
+        "frames": dict(sorted(by_frames.items())),
+        "examples": examples,
+        "minimal": minimal,
+    }
@@ -0,0 +1,126 @@
+# core/buddy_allocator.py
+"""
+Buddy Allocator untuk Frame Fisik
+Membagikan rangkaian frame kontigu berukuran 2^order dalam O(log n),
+dasar untuk huge page (mis. 2 MB = 512 frame 4 KB)
+"""
+
+import heapq
+
+
+class BuddyAllocator:
+    """
+    Buddy allocator klasik. Blok berorde k berisi 2^k frame dan selalu sejajar
+    (alamat awal kelipatan 2^k). Setiap orde memiliki set blok kosong ditambah
+    min-heap (dengan lazy deletion) agar blok beralamat terendah dipilih lebih dulu.
+    """
+    def __init__(self, num_frames):
+        self.num_frames = num_frames
+        self.max_order = max(num_frames.bit_length() - 1, 0)
+        self.reset()
+
+    def reset(self):
+        """Mengembalikan seluruh frame ke kondisi kosong"""
+        self.free_lists = [set() for _ in range(self.max_order + 1)]
+        self.heaps = [[] for _ in range(self.max_order + 1)]
+        self.allocated = {}      # Awal blok teralokasi -> orde
+        self.free_count = 0
+        # Pecah rentang frame menjadi blok sejajar sebesar mungkin (num_frames tidak harus 2^n)
+        start = 0
+        while start < self.num_frames:
+            order = self.max_order
+            while start % (1 << order) or start + (1 << order) > self.num_frames:
+                order -= 1
+            self._push(start, order)
+            start += 1 << order
+
+    def _push(self, start, order):
+        self.free_lists[order].add(start)
+        heap = self.heaps[order]
+        heapq.heappush(heap, start)
+        self.free_count += 1 << order
+        # Bangun ulang heap jika entri basi (lazy deletion) terlalu banyak
+        if len(heap) > 2 * len(self.free_lists[order]) + 64:
+            heap[:] = self.free_lists[order]
+            heapq.heapify(heap)
+
+    def _pop_lowest(self, order):
+        """Mengambil blok kosong beralamat terendah pada orde tertentu"""
+        heap = self.heaps[order]
+        free_list = self.free_lists[order]
+        while heap:
+            start = heapq.heappop(heap)
+            if start in free_list:
+                free_list.remove(start)
+                self.free_count -= 1 << order
+                return start
+        return -1
+
+    def allocate(self, order=0):
+        """
+        Alokasi blok 2^order frame kontigu
+        Return: frame awal blok, atau -1 jika tidak ada blok yang cukup besar
+        """
+        if order > self.max_order:
+            return -1
+        current = order
+        while current <= self.max_order and not self.free_lists[current]:
+            current += 1
+        if current > self.max_order:
+            return -1
+        start = self._pop_lowest(current)
+        # Pecah blok besar; separuh atas (buddy) kembali ke daftar kosong
+        while current > order:
+            current -= 1
+            self._push(start + (1 << current), current)
+        self.allocated[start] = order
+        return start
+
+    def free(self, start):
+        """Membebaskan blok dan menggabungkannya dengan buddy yang juga kosong"""
+        order = self.allocated.pop(start, None)
+        if order is None:
+            return
+        while order < self.max_order:
+            buddy = start ^ (1 << order)
+            if buddy not in self.free_lists[order]:
+                break
+            self.free_lists[order].remove(buddy)  # Entri heap dibuang secara lazy
+            self.free_count -= 1 << order
+            start = min(start, buddy)
+            order += 1
+        self._push(start, order)
+
+    def split(self, start):
+        """Memecah blok teralokasi menjadi blok-blok orde 0 yang dialokasikan terpisah"""
+        order = self.allocated.pop(start, 0)
+        for frame_number in range(start, start + (1 << order)):
+            self.allocated[frame_number] = 0
+
+    def block_order(self, start):
+        """Orde blok teralokasi yang dimulai pada frame start (None jika bukan awal blok)"""
+        return self.allocated.get(start)
+
+    def free_blocks(self):
+        """Jumlah blok kosong per orde"""
+        return {order: len(free_list) for order, free_list in enumerate(self.free_lists) if free_list}
+
+    def fragmentation(self, order):
+        """
+        Metrik fragmentasi untuk permintaan berorde order:
+        - largest_free_block: blok kosong terbesar (frame)
+        - external_fragmentation: 1 - blok terbesar / total frame kosong (%)
+        - unusable_free_index: porsi frame kosong di blok lebih kecil dari 2^order (%)
+        - blocks_available: jumlah blok 2^order yang masih dapat dialokasikan
+        """
+        largest = max((1 << o for o, free_list in enumerate(self.free_lists) if free_list), default=0)
+        usable = sum(len(free_list) << o for o, free_list in enumerate(self.free_lists) if o >= order)
+        free = self.free_count
+        return {
+            "free_frames": free,
+            "largest_free_block": largest,
+            "external_fragmentation": (1 - largest / free) * 100 if free else 0,
+            "unusable_free_index": ((free - usable) / free) * 100 if free else 0,
+            "blocks_available": usable >> order,
+            "free_blocks": self.free_blocks(),
+        }
@@ -0,0 +1,282 @@
+# core/cli.py
+"""
+Antarmuka Baris Perintah (headless) untuk Simulator Memori Virtual
+Menjalankan trace, sweep jumlah frame, benchmark, analisis ukuran halaman, dan
+pencarian Anomali Belady tanpa GUI, dengan keluaran JSON atau CSV.
+
+Modul GUI tidak pernah diimpor. NumPy hanya dimuat bila subperintah memerlukannya
+(--workload, trace .npy, rekaman, pagesize); multiprocessing hanya untuk subperintah belady.
+
+Contoh:
+    python -m core run --refs 1,2,3,4,1,2,5,1,2,3,4,5 --frames 3 --algorithm fifo
+    python -m core sweep --workload zipf --length 100000 --param num_pages=1024 --frames 8:64:8
+    python -m core benchmark --trace trace.txt --frames 32 --format csv
+    python -m core pagesize --trace alamat.npy --page-sizes 512,4096,65536 --frames 4:64:4
+    python -m core belady --candidates 1000000 --length 20 --pages 5
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from core.memory_manager import PhysicalMemory, MemoryManagementUnit
+from core.replacement_algorithms import FIFO, LRU
+
+ALGORITHMS = {"fifo": FIFO, "lru": LRU}
+
+
+def _parse_frames(text):
+    """'3', '4,8,16' atau rentang 'awal:akhir[:langkah]' (akhir inklusif) -> list int"""
+    if ":" in text:
+        parts = [int(p) for p in text.split(":")]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        return list(range(start, stop + 1, step))
+    return [int(p) for p in text.split(",") if p]
+
+
+def _parse_watermarks(text):
+    """'LOW,HIGH' -> (low, high) untuk --daemon"""
+    try:
+        low, high = (int(p) for p in text.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"harus berformat LOW,HIGH (dua bilangan bulat): {text!r}")
+    return low, high
+
+
+def _parse_param(text):
+    """'nama=nilai' -> (nama, int/float/str)"""
+    name, _, value = text.partition("=")
+    for cast in (int, float):
+        try:
+            return name, cast(value)
+        except ValueError:
+            pass
+    return name, value
+
+
+def _load_references(args):
+    """Membaca string referensi dari --refs, --trace (teks atau .npy), atau --workload"""
+    if args.refs:
+        return [int(p) for p in args.refs.replace(" ", "").split(",") if p]
+    if args.trace:
+        if args.trace.endswith(".npy"):
+            import numpy as np
+            return np.load(args.trace, mmap_mode="r")
+        with open(args.trace) as f:
+            return [int(p) for p in f.read().replace(",", " ").split()]
+    if args.workload:
+        from core.workloads import generate
+        params = dict(_parse_param(p) for p in args.param)
+        return generate(args.workload, args.length, seed=args.seed, **params)
+    raise SystemExit("Error: butuh salah satu dari --refs, --trace atau --workload.")
+
+
+def _build_mmu(args, num_frames, algorithm):
+    """Membuat MMU sesuai opsi baris perintah (swap, daemon, prefetch, huge page)"""
+    physical_memory = PhysicalMemory(num_frames, args.page_size, huge_page_size=args.huge_page_size)
+    swap_device = page_out_daemon = prefetcher = None
+    if args.swap:
+        from core.backing_store import SwapDevice
+        swap_device = SwapDevice(args.page_size, args.read_latency, args.write_latency, args.bandwidth)
+    if args.daemon:
+        from core.backing_store import PageOutDaemon
+        page_out_daemon = PageOutDaemon(*args.daemon)
+    if args.prefetch:
+        from core import prefetch
+        prefetcher = {"seq": prefetch.SequentialReadahead, "stride": prefetch.StridePrefetcher,
+                      "cluster": prefetch.ClusterPrefetcher}[args.prefetch]()
+    return MemoryManagementUnit(physical_memory, ALGORITHMS[algorithm](num_frames), swap_device,
+                                page_out_daemon, prefetcher=prefetcher)
+
+
+def _run_once(args, references, num_frames, algorithm, recorder=None):
+    """Menjalankan seluruh referensi pada MMU baru. Return: statistik + waktu eksekusi"""
+    mmu = _build_mmu(args, num_frames, algorithm)
+    pages = args.pages or int(max(references)) + 1
+    pid = mmu.create_process(pages * args.page_size, args.page_size, huge_pages=args.huge_pages)
+    if recorder:
+        mmu.attach_recorder(recorder)
+    rng = random.Random(args.seed)
+    write_ratio = args.write_ratio
+
+    try:
+        start_time = time.perf_counter()
+        for page_number in (references.tolist() if hasattr(references, "tolist") else references):
+            message, status = mmu.access_page(pid, page_number, write_ratio > 0 and rng.random() < write_ratio)
+            if status is None:
+                raise SystemExit(message)
+        duration_s = time.perf_counter() - start_time
+    finally:
+        if recorder:
+            mmu.detach_recorder()
+            recorder.close()
+    row = {"algorithm": algorithm, "frames": num_frames, "references": len(references)}
+    row.update(mmu.get_stats())
+    row["exec_time_ms"] = duration_s * 1000
+    row["throughput_ref_s"] = len(references) / duration_s if duration_s > 0 else 0
+    return row
+
+
+def _emit(rows, output_format, out=None):
+    """Menulis baris hasil sebagai JSON (list objek) atau CSV (nilai bersarang dijadikan JSON)"""
+    import json
+    out = out or sys.stdout
+    if output_format == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+        return
+    import csv
+    fieldnames = []
+    for row in rows:
+        fieldnames.extend(k for k in row if k not in fieldnames)
+    writer = csv.DictWriter(out, fieldnames=fieldnames, lineterminator="\n")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow({k: json.dumps(v) if isinstance(v, (dict, list)) else v for k, v in row.items()})
+
+
+def cmd_run(args):
+    references = _load_references(args)
+    frames = _parse_frames(args.frames)[0]
+    recorder = None
+    if args.record:
+        from core.recorder import RunRecorder
+        recorder = RunRecorder(args.record)
+    return [_run_once(args, references, frames, args.algorithm, recorder)]
+
+
+def cmd_sweep(args):
+    references = _load_references(args)
+    return [_run_once(args, references, frames, algorithm)
+            for algorithm in args.algorithms.split(",")
+            for frames in _parse_frames(args.frames)]
+
+
+def cmd_benchmark(args):
+    references = _load_references(args)
+    rows = []
+    for algorithm in args.algorithms.split(","):
+        for frames in _parse_frames(args.frames):
+            times = [_run_once(args, references, frames, algorithm)["exec_time_ms"] for _ in range(args.repeat)]
+            rows.append({
+                "algorithm": algorithm,
+                "frames": frames,
+                "references": len(references),
+                "repeat": args.repeat,
+                "best_ms": min(times),
+                "mean_ms": sum(times) / len(times),
+                "throughput_ref_s": len(references) / (min(times) / 1000) if min(times) > 0 else 0,
+            })
+    return rows
+
+
+def cmd_belady(args):
+    from core.belady import search_anomalies
+    result = search_anomalies(args.candidates, args.length, args.pages, mode=args.mode,
+                              seed=args.seed, processes=args.processes)
+    result["examples"] = [{"references": refs, "frames": m, "faults": f, "faults_more_frames": f1}
+                          for refs, m, f, f1 in result["examples"]]
+    return [result]
+
+
+def cmd_pagesize(args):
+    from core.page_size_analysis import page_size_sweep
+    if args.addresses:
+        addresses = [int(p, 0) for p in args.addresses.replace(" ", "").split(",") if p]
+    elif args.trace.endswith(".npy"):
+        import numpy as np
+        addresses = np.load(args.trace, mmap_mode="r")
+    else:
+        with open(args.trace) as f:
+            addresses = [int(p, 0) for p in f.read().replace(",", " ").split()]
+    return page_size_sweep(addresses, _parse_frames(args.page_sizes), _parse_frames(args.frames),
+                           args.algorithms.split(","))
+
+
+def _add_trace_options(parser):
+    """Opsi sumber referensi dan konfigurasi MMU yang dipakai run/sweep/benchmark"""
+    source = parser.add_argument_group("sumber referensi")
+    source.add_argument("--refs", help="string referensi halaman, contoh: 0,1,2,3")
+    source.add_argument("--trace", help="file trace (angka dipisah koma/spasi, atau .npy)")
+    source.add_argument("--workload", help="pola generator core.workloads (zipf, uniform, sequential, loop, phased, cyclic)")
+    source.add_argument("--length", type=int, default=100000, help="jumlah referensi untuk --workload")
+    source.add_argument("--param", action="append", default=[], metavar="NAMA=NILAI", help="parameter generator, contoh: num_pages=1024")
+    source.add_argument("--seed", type=int, default=0)
+
+    system = parser.add_argument_group("konfigurasi sistem")
+    system.add_argument("--page-size", type=int, default=4096, help="ukuran halaman (byte)")
+    system.add_argument("--pages", type=int, default=0, help="jumlah halaman virtual proses (default: halaman terbesar + 1)")
+    system.add_argument("--huge-page-size", type=int, default=None, help="ukuran huge page (byte)")
+    system.add_argument("--huge-pages", action="store_true", help="petakan proses dengan huge page")
+    system.add_argument("--write-ratio", type=float, default=0.0, help="porsi akses tulis (0-1)")
+    system.add_argument("--swap", action="store_true", help="aktifkan model swap (biaya I/O)")
+    system.add_argument("--read-latency", type=float, default=5.0, help="latensi baca swap (ms)")
+    system.add_argument("--write-latency", type=float, default=5.0, help="latensi tulis swap (ms)")
+    system.add_argument("--bandwidth", type=float, default=100.0, help="bandwidth swap (MB/s)")
+    system.add_argument("--daemon", metavar="LOW,HIGH", type=_parse_watermarks, help="aktifkan daemon page-out dengan watermark")
+    system.add_argument("--prefetch", choices=["seq", "stride", "cluster"], help="prefetcher")
+
+
+def build_parser():
+    # Opsi keluaran dipakai bersama semua subperintah
+    output = argparse.ArgumentParser(add_help=False)
+    output.add_argument("--format", choices=["json", "csv"], default="json", help="format keluaran")
+
+    parser = argparse.ArgumentParser(prog="python -m core", description="Simulator Memori Virtual (headless)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run = subparsers.add_parser("run", parents=[output], help="jalankan satu trace")
+    _add_trace_options(run)
+    run.add_argument("--frames", default="16", help="jumlah frame fisik")
+    run.add_argument("--algorithm", choices=sorted(ALGORITHMS), default="fifo")
+    run.add_argument("--record", metavar="DIR", help="rekam jalannya simulasi ke direktori ini")
+    run.set_defaults(handler=cmd_run)
+
+    sweep = subparsers.add_parser("sweep", parents=[output], help="sweep jumlah frame x algoritma")
+    _add_trace_options(sweep)
+    sweep.add_argument("--frames", default="1:16", help="daftar '4,8,16' atau rentang 'awal:akhir[:langkah]'")
+    sweep.add_argument("--algorithms", default="fifo,lru")
+    sweep.set_defaults(handler=cmd_sweep)
+
+    benchmark = subparsers.add_parser("benchmark", parents=[output], help="ukur waktu eksekusi dan throughput")
+    _add_trace_options(benchmark)
+    benchmark.add_argument("--frames", default="16")
+    benchmark.add_argument("--algorithms", default="fifo,lru")
+    benchmark.add_argument("--repeat", type=int, default=3)
+    benchmark.set_defaults(handler=cmd_benchmark)
+
+    pagesize = subparsers.add_parser("pagesize", parents=[output], help="sensitivitas ukuran halaman dari trace alamat byte")
+    source = pagesize.add_mutually_exclusive_group(required=True)
+    source.add_argument("--addresses", help="alamat virtual (byte), contoh: 0,4096,0x2000")
+    source.add_argument("--trace", help="file trace alamat byte (angka dipisah koma/spasi, atau .npy)")
+    pagesize.add_argument("--page-sizes", default="512,1024,2048,4096,8192,16384", help="daftar ukuran halaman (pangkat dua)")
+    pagesize.add_argument("--frames", default="4:64:4", help="daftar '4,8,16' atau rentang 'awal:akhir[:langkah]'")
+    pagesize.add_argument("--algorithms", default="fifo,lru")
+    pagesize.set_defaults(handler=cmd_pagesize)
+
+    belady = subparsers.add_parser("belady", parents=[output], help="cari Anomali Belady secara paralel")
+    belady.add_argument("--candidates", type=int, default=100000)
+    belady.add_argument("--length", type=int, default=20)
+    belady.add_argument("--pages", type=int, default=5)
+    belady.add_argument("--mode", choices=["random", "cyclic"], default="random")
+    belady.add_argument("--seed", type=int, default=0)
+    belady.add_argument("--processes", type=int, default=None, help="jumlah proses worker (default: semua core)")
+    belady.set_defaults(handler=cmd_belady)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        rows = args.handler(args)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    try:
+        _emit(rows, args.format)
+    except BrokenPipeError:
+        # Keluaran dipotong (mis. `| head`); jangan tampilkan traceback
+        sys.stderr.close()
+    return 0
@@ -0,0 +1,53 @@
+# core/fault_curves.py
+"""
+Kurva Page Fault
+Menghitung jumlah page fault untuk setiap jumlah frame dari satu string referensi
+tanpa menjalankan MMU lengkap
+"""
+
+# Pola klasik Anomali Belady (Test Case 4): 1,2,3,4,1,2,5,1,2,3,4,5
+BELADY_PATTERN = (0, 1, 2, 3, 0, 1, 4, 0, 1, 2, 3, 4)
+
+
+def fifo_faults(references, num_frames):
+    """
+    Jumlah page fault FIFO dengan num_frames frame.
+    Pada FIFO, hit tidak mengubah state dan setiap fault memuat tepat satu halaman,
+    sehingga halaman yang dimuat pada fault ke-t masih resident selama
+    jumlah fault belum melebihi t + num_frames. Cukup satu dict per referensi.
+    """
+    loaded_at = {}
+    faults = 0
+    for page in references:
+        t = loaded_at.get(page)
+        if t is None or t < faults - num_frames:
+            loaded_at[page] = faults
+            faults += 1
+    return faults
+
+
+def fifo_fault_curve(references, max_frames=None):
+    """
+    Kurva page fault FIFO untuk 1..max_frames frame (default: jumlah halaman unik)
+    Return: list, elemen ke-(m-1) adalah jumlah fault dengan m frame
+    """
+    references = list(references)
+    distinct = len(set(references))
+    if max_frames is None:
+        max_frames = distinct
+    curve = []
+    for num_frames in range(1, max_frames + 1):
+        # Dengan frame >= halaman unik, hanya terjadi compulsory miss
+        if num_frames >= distinct:
+            curve.append(distinct)
+        else:
+            curve.append(fifo_faults(references, num_frames))
+    return curve
+
+
+def find_anomalies(curve):
+    """
+    Mencari Anomali Belady pada kurva: titik di mana frame bertambah tetapi fault ikut bertambah
+    Return: list (m, fault dengan m frame, fault dengan m+1 frame)
+    """
+    return [(m, curve[m - 1], curve[m]) for m in range(1, len(curve)) if curve[m] > curve[m - 1]]
@@ -6,6 +6,7 @@ Mengimplementasikan simulasi sistem manajemen memori virtual dengan paging
 
 import math
 from core.replacement_algorithms import FIFO, LRU
+from core.buddy_allocator import BuddyAllocator
 
 class PageTableEntry:
     """
@@ -15,6 +16,10 @@ class PageTableEntry:
     def __init__(self):
         self.frame_number = -1  # Nomor frame di memori fisik (-1 jika tidak valid)
         self.valid = False      # Status apakah halaman ada di memori fisik
+        self.cow = False        # Copy-on-write: frame dibagi, salin saat ditulis
+        self.read_only = False  # Pemetaan hanya-baca (mis. halaman bersama)
+        self.prefetched = False # Dimuat oleh prefetcher dan belum pernah diakses
+        self.huge = False       # Bagian dari huge page (dipetakan dan dikeluarkan sebagai satu unit)
 
 class Process:
     """
@@ -23,6 +28,7 @@ class Process:
     """
     def __init__(self, pid, virtual_address_space_size, page_size):
         self.pid = pid
+        self.page_size = page_size
         self.num_pages = math.ceil(virtual_address_space_size / page_size)
         self.page_table = [PageTableEntry() for _ in range(self.num_pages)]
 
@@ -35,36 +41,138 @@ class Process:
 class PhysicalMemory:
     """
     Representasi memori fisik (RAM) yang terdiri dari frame-frame
-    Mengelola alokasi dan dealokasi frame untuk halaman-halaman proses
+    Mengelola alokasi dan dealokasi frame untuk halaman-halaman proses.
+    Frame dibagikan oleh buddy allocator sehingga huge page (2^order frame
+    kontigu) dapat dialokasikan berdampingan dengan halaman biasa.
     """
-    def __init__(self, num_frames, page_size):
+    def __init__(self, num_frames, page_size, huge_page_size=None):
         self.num_frames = num_frames
         self.page_size = page_size
-        self.frames = [None] * num_frames        # Isi setiap frame: (pid, page_number) atau None
-        self.free_frames = list(range(num_frames))  # Daftar frame yang masih kosong
+        self.frames = [None] * num_frames        # Isi setiap frame: (pid, page_number) pemilik utama atau None
+        self.mappers = [None] * num_frames       # Reverse map: set (pid, page_number) yang memetakan frame
+        self.dirty = [False] * num_frames        # Dirty bit per frame: isi berubah sejak dimuat
+        self.allocator = BuddyAllocator(num_frames)  # Pengelola frame kosong
+        self.observer = None                     # Callback (frame, isi) saat isi frame berubah, mis. recorder
+        # Orde huge page: huge_page_size = page_size * 2^huge_page_order (0 jika tidak didukung)
+        self.huge_page_order = 0
+        if huge_page_size:
+            ratio = huge_page_size // page_size
+            if ratio < 2 or ratio & (ratio - 1) or ratio * page_size != huge_page_size:
+                raise ValueError("Ukuran huge page harus kelipatan 2^n dari ukuran halaman.")
+            self.huge_page_order = ratio.bit_length() - 1
+
+    @property
+    def free_frames(self):
+        """Daftar frame yang masih kosong (terurut)"""
+        return [f for f, content in enumerate(self.frames) if content is None]
+
+    def free_frame_count(self):
+        """Jumlah frame kosong"""
+        return self.allocator.free_count
 
     def allocate_frame(self, pid, page_number):
         """
         Alokasi frame kosong untuk halaman tertentu dari proses
         Return: nomor frame yang dialokasikan, atau -1 jika tidak ada frame kosong
         """
-        if not self.free_frames:
+        return self.allocate_block(pid, page_number, 0)
+
+    def allocate_block(self, pid, page_number, order):
+        """
+        Alokasi 2^order frame kontigu untuk halaman page_number dan seterusnya
+        Return: frame pertama blok, atau -1 jika tidak ada blok yang cukup besar
+        """
+        start = self.allocator.allocate(order)
+        if start == -1:
             return -1
-        frame_number = self.free_frames.pop(0)
-        self.frames[frame_number] = (pid, page_number)
-        return frame_number
+        for offset in range(1 << order):
+            self._set_frame(start + offset, (pid, page_number + offset))
+            self.mappers[start + offset] = {(pid, page_number + offset)}
+            self.dirty[start + offset] = False
+        return start
+
+    def block_size(self, frame_number):
+        """Jumlah frame dalam blok yang dimulai pada frame_number (1 untuk halaman biasa)"""
+        return 1 << (self.allocator.block_order(frame_number) or 0)
+
+    def split_block(self, frame_number):
+        """Memecah blok huge page menjadi frame-frame biasa tanpa memindahkan isinya"""
+        self.allocator.split(frame_number)
 
     def free_frame(self, frame_number):
-        """Membebaskan frame dan mengembalikannya ke daftar frame kosong"""
+        """Membebaskan frame (atau seluruh blok yang dimulai di frame ini) ke allocator"""
         if 0 <= frame_number < self.num_frames and self.frames[frame_number] is not None:
-            self.frames[frame_number] = None
-            self.free_frames.append(frame_number)
-            self.free_frames.sort()
+            for f in range(frame_number, frame_number + self.block_size(frame_number)):
+                self._set_frame(f, None)
+                self.mappers[f] = None
+                self.dirty[f] = False
+            self.allocator.free(frame_number)
+
+    def _set_frame(self, frame_number, content):
+        """Mengubah isi frame dan memberi tahu observer (jika ada)"""
+        self.frames[frame_number] = content
+        if self.observer:
+            self.observer(frame_number, content)
+
+    def is_dirty(self, frame_number):
+        """Apakah ada frame dalam blok yang dimulai di frame_number yang dirty"""
+        return any(self.dirty[frame_number:frame_number + self.block_size(frame_number)])
+
+    def get_fragmentation(self):
+        """Metrik fragmentasi memori fisik terhadap permintaan huge page"""
+        return self.allocator.fragmentation(self.huge_page_order)
+
+    def reset(self):
+        """Mengosongkan seluruh frame"""
+        if self.observer:
+            for frame_number, content in enumerate(self.frames):
+                if content is not None:
+                    self.observer(frame_number, None)
+        self.frames = [None] * self.num_frames
+        self.mappers = [None] * self.num_frames
+        self.dirty = [False] * self.num_frames
+        self.allocator.reset()
+
+    def add_mapping(self, frame_number, pid, page_number):
+        """Menambahkan pemetaan (pid, page_number) ke frame yang sudah terisi"""
+        self.mappers[frame_number].add((pid, page_number))
+
+    def remove_mapping(self, frame_number, pid, page_number):
+        """
+        Menghapus satu pemetaan dari frame. Frame tidak dibebaskan di sini.
+        Return: jumlah pemetaan yang tersisa pada frame
+        """
+        mappers = self.mappers[frame_number]
+        if not mappers:
+            return 0
+        mappers.discard((pid, page_number))
+        # Pindahkan kepemilikan utama jika pemilik lama melepas frame
+        if mappers and self.frames[frame_number] == (pid, page_number):
+            self._set_frame(frame_number, min(mappers))
+        return len(mappers)
+
+    def clear_mappings(self, frame_number):
+        """
+        Mencabut semua pemetaan frame tanpa membebaskannya (mis. selama write-back)
+        Return: set pemetaan sebelum dicabut
+        """
+        mappers = self.mappers[frame_number] or set()
+        self.mappers[frame_number] = set()
+        return mappers
+
+    def mark_dirty(self, frame_number):
+        """Menandai frame telah ditulis (perlu write-back saat dikeluarkan)"""
+        self.dirty[frame_number] = True
+
+    def ref_count(self, frame_number):
+        """Jumlah pemetaan (reference count) pada frame"""
+        mappers = self.mappers[frame_number]
+        return len(mappers) if mappers else 0
 
     def find_frame_by_page(self, pid, page_number):
         """Mencari nomor frame berdasarkan PID dan nomor halaman"""
-        for frame_num, content in enumerate(self.frames):
-            if content and content[0] == pid and content[1] == page_number:
+        for frame_num, mappers in enumerate(self.mappers):
+            if mappers and (pid, page_number) in mappers:
                 return frame_num
         return -1
 
@@ -73,139 +181,634 @@ class MemoryManagementUnit:
     """
     Unit Pengelola Memori (MMU) - komponen utama yang menangani:
     - Translasi alamat virtual ke alamat fisik
-    - Penanganan page fault
+    - Penanganan page fault dan copy-on-write fault
     - Pengelolaan algoritma penggantian halaman
+    - Biaya I/O swap (opsional) dan daemon page-out (opsional)
+    - Prefetch/readahead pada jalur page fault (opsional)
+    - Huge page: promosi/demosi dan fault sebagai satu unit 2^order frame
     """
-    def __init__(self, physical_memory, replacement_algorithm):
+    def __init__(self, physical_memory, replacement_algorithm, swap_device=None, page_out_daemon=None, access_time_ms=0.0001, prefetcher=None):
         self.physical_memory = physical_memory
         self.replacement_algorithm = replacement_algorithm
+        self.swap_device = swap_device           # SwapDevice untuk biaya baca/tulis halaman
+        self.page_out_daemon = page_out_daemon   # PageOutDaemon untuk menjaga frame kosong
+        self.access_time_ms = access_time_ms     # Waktu simulasi per referensi memori
+        self.prefetcher = prefetcher             # Prefetcher untuk readahead saat page fault
+        self.prefetch_inflight = {}              # Frame prefetch -> waktu selesai baca dari swap
         self.processes = {}                      # Daftar semua proses aktif
         self.next_pid = 0                        # Counter untuk PID berikutnya
-        self.stats = {"hits": 0, "faults": 0}    # Statistik performa sistem
+        self.clock = 0.0                         # Waktu simulasi (ms)
+        self.fault_latencies = []                # Latensi layanan tiap page fault (ms)
+        self.prefetch_stall_ms = 0.0             # Total waktu menunggu halaman prefetch yang belum selesai dibaca
+        self.recorder = None                     # RunRecorder untuk merekam setiap akses (opsional)
+        self.last_victim = None                  # (pid, halaman) korban pertama pada akses terakhir
+        self.stats = self._empty_stats()    # Statistik performa sistem
 
-    def create_process(self, virtual_size, page_size):
+    @staticmethod
+    def _empty_stats():
+        """Statistik awal: hit/fault, COW fault, write-back dan akuntansi prefetch"""
+        return {
+            "hits": 0, "faults": 0, "cow_faults": 0, "writebacks": 0,
+            "prefetch_issued": 0,     # Halaman yang dimuat oleh prefetcher
+            "prefetch_useful": 0,     # Halaman prefetch yang kemudian diakses
+            "prefetch_unused": 0,     # Halaman prefetch yang dikeluarkan sebelum diakses
+            "prefetch_displaced": 0,  # Halaman resident yang dikorbankan demi prefetch
+            "huge_faults": 0, "huge_promotions": 0, "huge_demotions": 0,
+        }
+
+    def create_process(self, virtual_size, page_size, huge_pages=False):
         """
         Membuat proses baru dengan ruang alamat virtual tertentu
+        Dengan huge_pages=True, setiap region sejajar yang utuh dipetakan sebagai huge page
+        (hanya jika satu huge page muat di memori fisik)
         Return: PID proses yang baru dibuat
         """
         pid = self.next_pid
         process = Process(pid, virtual_size, page_size)
+        span = 1 << self.physical_memory.huge_page_order
+        # Region lebih besar dari memori fisik tidak akan pernah muat; tetap halaman biasa
+        if huge_pages and 1 < span <= self.physical_memory.num_frames:
+            for page_number in range(process.num_pages - process.num_pages % span):
+                process.page_table[page_number].huge = True
         self.processes[pid] = process
         self.next_pid += 1
         return pid
 
+    def promote_huge_page(self, pid, page_number):
+        """
+        Mempromosikan region sejajar yang memuat page_number menjadi satu huge page.
+        Halaman resident disalin ke blok kontigu baru (tanpa I/O), halaman lain dibaca
+        dari swap. Region yang belum resident cukup ditandai huge (dimuat saat fault).
+        Return: True jika region sekarang huge page, False jika tidak memenuhi syarat
+        """
+        order = self.physical_memory.huge_page_order
+        if not order or pid not in self.processes:
+            return False
+        process = self.processes[pid]
+        span = 1 << order
+        base = page_number - page_number % span
+        if base < 0 or base + span > process.num_pages or span > self.physical_memory.num_frames:
+            return False
+        entries = process.page_table[base:base + span]
+        if entries[0].huge:
+            return True
+        # Halaman bersama atau hanya-baca tidak dapat digabung ke huge page privat
+        if any(e.cow or e.read_only or (e.valid and self.physical_memory.ref_count(e.frame_number) > 1) for e in entries):
+            return False
+
+        resident = [i for i, e in enumerate(entries) if e.valid]
+        dirty = [i for i in resident if self.physical_memory.dirty[entries[i].frame_number]]
+        for i in resident:
+            self._unmap_page(pid, base + i, entries[i])
+        for entry in entries:
+            entry.huge = True
+        self.stats["huge_promotions"] += 1
+        if not resident:
+            return True
+
+        head, _ = self._acquire_frame(pid, base, order)
+        if head == -1:
+            # Tetap huge; region dimuat utuh pada fault berikutnya. Isi halaman dirty
+            # yang sudah dilepas harus ditulis balik agar tidak hilang.
+            if dirty:
+                self.stats["writebacks"] += len(dirty)
+                if self.swap_device:
+                    self.clock = self.swap_device.write_page(self.clock, len(dirty))
+            return True
+        missing = span - len(resident)
+        if missing and self.swap_device:
+            self.clock = self.swap_device.read_page(self.clock, missing)
+        for i, entry in enumerate(entries):
+            entry.frame_number = head + i
+            entry.valid = True
+        for i in dirty:
+            self.physical_memory.mark_dirty(head + i)
+        self.replacement_algorithm.page_loaded(head, base, span)
+        return True
+
+    def demote_huge_page(self, pid, page_number):
+        """
+        Mendemosikan huge page yang memuat page_number menjadi halaman-halaman biasa.
+        Blok fisik dan unit penggantiannya dipecah di tempat: setiap halaman menjadi
+        unit sendiri dengan posisi FIFO/LRU yang sama dengan huge page asalnya.
+        Return: True jika region sekarang berisi halaman biasa, False jika proses tidak valid
+        """
+        order = self.physical_memory.huge_page_order
+        if pid not in self.processes:
+            return False
+        process = self.processes[pid]
+        entry = process.get_page_entry(page_number)
+        if entry is None:
+            return False
+        if not order or not entry.huge:
+            return True
+        span = 1 << order
+        base = page_number - page_number % span
+        entries = process.page_table[base:base + span]
+        if entries[0].valid:
+            head = entries[0].frame_number
+            self.physical_memory.split_block(head)
+            self.replacement_algorithm.split_unit(head)
+        for entry in entries:
+            entry.huge = False
+        self.stats["huge_demotions"] += 1
+        return True
+
+    def fork_process(self, pid):
+        """
+        Membuat salinan proses dengan semantik copy-on-write.
+        Hanya tabel halaman yang disalin: setiap halaman valid dipetakan ke frame
+        yang sama dan ditandai COW di kedua proses, sehingga biaya fork sebanding
+        dengan ukuran tabel halaman, bukan isi memori.
+        Return: PID proses anak, atau -1 jika proses induk tidak ditemukan
+        """
+        if pid not in self.processes:
+            return -1
+        parent = self.processes[pid]
+        # Huge page induk dipecah dulu agar COW dapat bekerja per halaman
+        span = 1 << self.physical_memory.huge_page_order
+        if span > 1:
+            for base in range(0, parent.num_pages, span):
+                if parent.page_table[base].huge:
+                    self.demote_huge_page(pid, base)
+        child_pid = self.next_pid
+        child = Process(child_pid, parent.num_pages * parent.page_size, parent.page_size)
+
+        for page_number, entry in enumerate(parent.page_table):
+            child_entry = child.page_table[page_number]
+            child_entry.read_only = entry.read_only
+            if not entry.valid:
+                continue
+            child_entry.frame_number = entry.frame_number
+            child_entry.valid = True
+            # Halaman hanya-baca cukup dibagi; halaman writable menjadi COW
+            if not entry.read_only:
+                entry.cow = True
+                child_entry.cow = True
+            self.physical_memory.add_mapping(entry.frame_number, child_pid, page_number)
+
+        self.processes[child_pid] = child
+        self.next_pid += 1
+        return child_pid
+
+    def map_shared(self, pid, page_number, target_pid, target_page):
+        """
+        Memetakan halaman resident milik proses pid ke halaman target_page milik
+        target_pid sebagai pemetaan bersama hanya-baca (reference count bertambah)
+        Return: True jika berhasil, False jika proses/halaman tidak valid
+        """
+        if pid not in self.processes or target_pid not in self.processes:
+            return False
+        entry = self.processes[pid].get_page_entry(page_number)
+        target_entry = self.processes[target_pid].get_page_entry(target_page)
+        if entry is None or target_entry is None or not entry.valid:
+            return False
+        if target_entry is entry:
+            return True
+        if entry.huge:
+            self.demote_huge_page(pid, page_number)
+        if target_entry.huge:
+            self.demote_huge_page(target_pid, target_page)
+
+        # Lepaskan pemetaan lama halaman target terlebih dahulu
+        if target_entry.valid:
+            self._unmap_page(target_pid, target_page, target_entry)
+
+        entry.read_only = True
+        entry.cow = False
+        target_entry.frame_number = entry.frame_number
+        target_entry.valid = True
+        target_entry.read_only = True
+        target_entry.cow = False
+        self.physical_memory.add_mapping(entry.frame_number, target_pid, target_page)
+        return True
+
     def terminate_process(self, pid):
         """
         Menghentikan proses dan membebaskan semua frame yang dialokasikan
+        Frame yang masih dipetakan proses lain tetap dipertahankan
         Return: True jika berhasil, False jika proses tidak ditemukan
         """
         if pid in self.processes:
             process = self.processes[pid]
-            # Bebaskan semua frame yang dialokasikan untuk proses ini
-            for page_entry in process.page_table:
-                if page_entry.valid:
-                    # Penting: panggil page_removed di algoritma untuk update state internalnya
-                    self.replacement_algorithm.page_removed(page_entry.frame_number)
-                    self.physical_memory.free_frame(page_entry.frame_number)
+            # Lepaskan semua pemetaan milik proses ini
+            for page_number, page_entry in enumerate(process.page_table):
+                if not page_entry.valid:
+                    continue
+                if page_entry.huge:
+                    # Huge page tidak pernah dibagi: seluruh blok dikeluarkan sekaligus
+                    self._evict_frame(page_entry.frame_number)
+                else:
+                    self._unmap_page(pid, page_number, page_entry)
             del self.processes[pid]
             return True
         return False
 
-    def access_virtual_address(self, pid, virtual_address):
+    def access_virtual_address(self, pid, virtual_address, write=False):
         """
         Mengakses alamat virtual - mengkonversi ke nomor halaman dan memanggil access_page
         """
         page_size = self.physical_memory.page_size
         page_number = virtual_address // page_size
-        return self.access_page(pid, page_number)
+        return self.access_page(pid, page_number, write)
+
+    def attach_recorder(self, recorder):
+        """Memasang RunRecorder: setiap akses dan perubahan frame sesudahnya ikut direkam"""
+        self.recorder = recorder
+        recorder.start(self.physical_memory)
+        self.physical_memory.observer = recorder.frame_changed
 
-    def access_page(self, pid, page_number):
+    def detach_recorder(self):
+        """Melepas recorder (rekaman ditutup oleh pemanggil dengan recorder.close())"""
+        self.recorder = None
+        self.physical_memory.observer = None
+
+    def access_page(self, pid, page_number, write=False):
         """
-        Logika inti akses halaman - menangani page hit dan page fault
+        Mengakses halaman lewat _access_page dan mencatat hasilnya ke recorder (jika terpasang)
+        """
+        self.last_victim = None
+        message, status = self._access_page(pid, page_number, write)
+        if self.recorder:
+            frame_number = -1
+            process = self.processes.get(pid)
+            page_entry = process.get_page_entry(page_number) if process else None
+            if page_entry and page_entry.valid:
+                frame_number = page_entry.frame_number
+            victim = self.last_victim if status in ("fault_replace", "cow_fault") else None
+            self.recorder.record_access(pid, page_number, status, frame_number, victim)
+        return message, status
+
+    def _access_page(self, pid, page_number, write=False):
+        """
+        Logika inti akses halaman - menangani page hit, page fault dan COW fault
         """
         # Validasi proses dan halaman
         if pid not in self.processes:
             return "Error: Process ID tidak ditemukan.", None
         
         process = self.processes[pid]
-        if page_number >= process.num_pages:
+        if not 0 <= page_number < process.num_pages:
             return f"Error: Halaman {page_number} di luar batas untuk Proses {pid}.", None
 
         page_entry = process.get_page_entry(page_number)
 
+        if write and page_entry.read_only:
+            return f"Error: Protection fault, halaman {page_number} (P{pid}) hanya-baca.", None
+
+        self.clock += self.access_time_ms
+        if self.page_out_daemon:
+            self.page_out_daemon.run(self, self.clock)
+
         # Kasus 1: Page Hit - halaman sudah ada di memori fisik
         if page_entry.valid:
+            # Penulisan ke halaman COW bukan hit: dihitung terpisah sebagai cow_faults
+            if write and page_entry.cow:
+                return self._handle_cow_fault(pid, page_number, page_entry)
             self.stats["hits"] += 1
-            self.replacement_algorithm.page_accessed(page_entry.frame_number, page_number)
+            if write:
+                self.physical_memory.mark_dirty(page_entry.frame_number)
+            self.replacement_algorithm.page_accessed(self._unit_frame(page_number, page_entry), page_number)
+            if page_entry.prefetched:
+                self._prefetch_hit(pid, page_number, page_entry)
             return f"Hit! Halaman {page_number} ada di Frame {page_entry.frame_number}", "hit"
 
         # Kasus 2: Page Fault - halaman tidak ada di memori fisik
         self.stats["faults"] += 1
-        
+        fault_start = self.clock
+
+        if page_entry.huge:
+            return self._handle_huge_fault(pid, page_number, write, fault_start)
+
+        frame_number, victim = self._acquire_frame(pid, page_number)
+        if frame_number == -1:
+            return victim, None
+
+        # Baca halaman dari swap (sinkron, proses menunggu)
+        if self.swap_device:
+            self.clock = self.swap_device.read_page(self.clock)
+            self.fault_latencies.append(self.clock - fault_start)
+
+        page_entry.frame_number = frame_number
+        page_entry.valid = True
+        page_entry.cow = False
+        if write:
+            self.physical_memory.mark_dirty(frame_number)
+        self.replacement_algorithm.page_loaded(frame_number, page_number)
+
+        prefetch_note = ""
+        if self.prefetcher:
+            loaded = self._prefetch(pid, self.prefetcher.on_fault(pid, page_number))
+            if loaded:
+                prefetch_note = f" (+{loaded} halaman prefetch)"
+
         # Kasus 2a: Ada frame kosong tersedia
-        free_frame_num = self.physical_memory.allocate_frame(pid, page_number)
-        if free_frame_num != -1:
-            page_entry.frame_number = free_frame_num
+        if victim is None:
+            return f"Page Fault! Frame kosong {frame_number} dialokasikan untuk halaman {page_number}.{prefetch_note}", "fault_free"
+
+        # Kasus 2b: Tidak ada frame kosong - halaman korban diganti
+        victim_pid, victim_page_number = victim
+        return f"Page Fault! Halaman {victim_page_number} (P{victim_pid}) di frame {frame_number} diganti oleh halaman {page_number} (P{pid}).{prefetch_note}", "fault_replace"
+
+    def _handle_huge_fault(self, pid, page_number, write, fault_start):
+        """Page fault pada region huge page: seluruh region dimuat ke satu blok kontigu"""
+        self.stats["huge_faults"] += 1
+        process = self.processes[pid]
+        order = self.physical_memory.huge_page_order
+        span = 1 << order
+        base = page_number - page_number % span
+
+        head, victim = self._acquire_frame(pid, base, order)
+        if head == -1:
+            return victim, None
+
+        if self.swap_device:
+            self.clock = self.swap_device.read_page(self.clock, span)
+            self.fault_latencies.append(self.clock - fault_start)
+
+        for i, entry in enumerate(process.page_table[base:base + span]):
+            entry.frame_number = head + i
+            entry.valid = True
+            entry.cow = False
+            entry.prefetched = False
+        if write:
+            self.physical_memory.mark_dirty(head + page_number - base)
+        self.replacement_algorithm.page_loaded(head, base, span)
+
+        if victim is None:
+            return f"Page Fault! Huge page {base}-{base + span - 1} dimuat ke Frame {head}-{head + span - 1}.", "fault_free"
+        victim_pid, victim_page_number = victim
+        return f"Page Fault! Halaman {victim_page_number} (P{victim_pid}) diganti, huge page {base}-{base + span - 1} (P{pid}) dimuat ke Frame {head}-{head + span - 1}.", "fault_replace"
+
+    def _unit_frame(self, page_number, page_entry):
+        """Frame yang mewakili unit penggantian halaman (frame pertama untuk huge page)"""
+        if page_entry.huge:
+            return page_entry.frame_number - page_number % (1 << self.physical_memory.huge_page_order)
+        return page_entry.frame_number
+
+    def _prefetch(self, pid, candidates):
+        """
+        Memuat halaman kandidat prefetch melalui jalur alokasi frame yang sama
+        dengan page fault. Pembacaan swap bersifat asinkron (tidak menambah clock);
+        setiap rangkaian halaman berurutan dibaca sebagai satu transfer.
+        Jumlah halaman per batch dibatasi agar prefetch tidak mengusir seluruh memori,
+        dan halaman prefetch lain yang belum diakses tidak pernah dijadikan korban.
+        Kandidat yang tidak sempat dimuat dilaporkan ke prefetcher (on_prefetch_truncated).
+        Return: jumlah halaman yang dimuat
+        """
+        process = self.processes[pid]
+        limit = max(self.physical_memory.num_frames // 2, 1)
+        loaded = 0
+        run = []  # Frame untuk rangkaian halaman berurutan yang belum dikirim ke swap
+        for index, page_number in enumerate(candidates):
+            if loaded >= limit:
+                self.prefetcher.on_prefetch_truncated(pid, candidates[index:])
+                break
+            page_entry = process.get_page_entry(page_number)
+            if page_entry is None or page_entry.valid or page_entry.huge:
+                continue
+            frame_number, victim = self._acquire_frame(pid, page_number, skip=self._is_unused_prefetch)
+            if frame_number == -1:
+                self.prefetcher.on_prefetch_truncated(pid, candidates[index:])
+                break
+            if victim is not None:
+                self.stats["prefetch_displaced"] += 1
+            if run and page_number != run_end + 1:
+                self._read_prefetch_run(run)
+                run = []
+            run.append(frame_number)
+            run_end = page_number
+            page_entry.frame_number = frame_number
             page_entry.valid = True
-            self.replacement_algorithm.page_loaded(free_frame_num, page_number)
-            return f"Page Fault! Frame kosong {free_frame_num} dialokasikan untuk halaman {page_number}.", "fault_free"
+            page_entry.cow = False
+            page_entry.prefetched = True
+            self.replacement_algorithm.page_loaded(frame_number, page_number)
+            self.stats["prefetch_issued"] += 1
+            loaded += 1
+        if run:
+            self._read_prefetch_run(run)
+        return loaded
 
-        # Kasus 2b: Tidak ada frame kosong - perlu penggantian halaman
-        victim_frame_num = self.replacement_algorithm.select_victim()
-        
-        if victim_frame_num == -1:
-            return "Error: Gagal memilih frame korban.", None
-
-        # Ambil informasi halaman korban yang akan diganti
-        victim_content = self.physical_memory.frames[victim_frame_num]
-        if not victim_content:
-            return "Error: Frame korban kosong secara tidak terduga.", None
-            
-        victim_pid, victim_page_number = victim_content
-
-        # Update tabel halaman proses korban - tandai sebagai tidak valid
-        if victim_pid in self.processes:
-            victim_process = self.processes[victim_pid]
-            victim_page_entry = victim_process.get_page_entry(victim_page_number)
-            if victim_page_entry:
-                victim_page_entry.valid = False
-                victim_page_entry.frame_number = -1
-
-        # Load halaman baru ke frame korban
-        self.physical_memory.frames[victim_frame_num] = (pid, page_number)
-        page_entry.frame_number = victim_frame_num
+    def _read_prefetch_run(self, frames):
+        """Mengirim satu transfer swap untuk rangkaian halaman prefetch berurutan"""
+        if not self.swap_device:
+            return
+        done = self.swap_device.read_page(self.clock, len(frames))
+        for frame_number in frames:
+            self.prefetch_inflight[frame_number] = done
+
+    def _is_unused_prefetch(self, frame_number):
+        """Apakah frame berisi halaman prefetch yang belum pernah diakses"""
+        for pid, page_number in self.physical_memory.mappers[frame_number] or ():
+            process = self.processes.get(pid)
+            if process and process.page_table[page_number].prefetched:
+                return True
+        return False
+
+    def _prefetch_hit(self, pid, page_number, page_entry):
+        """Akses pertama ke halaman prefetch: tunggu I/O jika belum selesai, lalu beri umpan balik"""
+        page_entry.prefetched = False
+        self.stats["prefetch_useful"] += 1
+        ready_time = self.prefetch_inflight.pop(page_entry.frame_number, None)
+        if ready_time is not None and ready_time > self.clock:
+            self.prefetch_stall_ms += ready_time - self.clock
+            self.clock = ready_time
+        self._prefetch(pid, self.prefetcher.on_prefetch_hit(pid, page_number))
+
+    def _handle_cow_fault(self, pid, page_number, page_entry):
+        """
+        Menangani penulisan ke halaman COW: salin ke frame privat jika frame
+        masih dibagi, atau cukup tandai writable jika tinggal satu pemetaan
+        """
+        self.stats["cow_faults"] += 1
+        old_frame = page_entry.frame_number
+
+        if self.physical_memory.ref_count(old_frame) <= 1:
+            page_entry.cow = False
+            self.physical_memory.mark_dirty(old_frame)
+            self.replacement_algorithm.page_accessed(old_frame, page_number)
+            return f"COW Fault! Halaman {page_number} (P{pid}) tidak lagi dibagi, Frame {old_frame} menjadi writable.", "cow_fault"
+
+        frame_number, victim = self._acquire_frame(pid, page_number)
+        if frame_number == -1:
+            return victim, None
+
+        # Frame lama bisa saja terpilih sebagai korban, sehingga pemetaan ini sudah dicabut
+        if page_entry.valid:
+            self.physical_memory.remove_mapping(old_frame, pid, page_number)
+
+        page_entry.frame_number = frame_number
         page_entry.valid = True
-        
-        # Update algoritma penggantian
-        self.replacement_algorithm.page_loaded(victim_frame_num, page_number)
-        
-        return f"Page Fault! Halaman {victim_page_number} (P{victim_pid}) di frame {victim_frame_num} diganti oleh halaman {page_number} (P{pid}).", "fault_replace"
+        page_entry.cow = False
+        self.physical_memory.mark_dirty(frame_number)
+        self.replacement_algorithm.page_loaded(frame_number, page_number)
+        return f"COW Fault! Halaman {page_number} (P{pid}) disalin dari Frame {old_frame} ke Frame {frame_number}.", "cow_fault"
+
+    def _acquire_frame(self, pid, page_number, order=0, skip=None):
+        """
+        Mendapatkan 2^order frame kontigu untuk (pid, page_number): dari frame kosong
+        atau dengan mengeluarkan korban sampai buddy allocator dapat memenuhi permintaan.
+        Untuk order > 0, seluruh region sejajar 2^order yang memuat korban ikut dikosongkan.
+        Frame yang membuat skip(frame) bernilai True tidak dijadikan korban.
+        Return: (frame pertama, (pid, halaman) korban pertama atau None), atau (-1, pesan error)
+        """
+        if order > self.physical_memory.allocator.max_order:
+            return -1, "Error: Huge page lebih besar dari memori fisik."
+        first_victim = None
+        while True:
+            frame_number = self.physical_memory.allocate_block(pid, page_number, order)
+            if frame_number != -1:
+                return frame_number, first_victim
+
+            # Jika daemon sedang menulis balik halaman, tunggu frame tersebut selesai
+            if self.page_out_daemon:
+                ready_time = self.page_out_daemon.wait_for_frame(self.physical_memory, self.clock)
+                if ready_time is not None:
+                    self.clock = ready_time
+                    continue
+
+            victim_frame_num = self.replacement_algorithm.select_victim(skip)
+            if victim_frame_num == -1:
+                return -1, "Error: Gagal memilih frame korban."
+
+            victim_content = self.physical_memory.frames[victim_frame_num]
+            if not victim_content:
+                return -1, "Error: Frame korban kosong secara tidak terduga."
+
+            # Korban sudah dikeluarkan dari struktur algoritma oleh select_victim
+            self._write_back_and_evict(victim_frame_num, notify_algorithm=False)
+            if order:
+                self._evict_region(victim_frame_num, order)
+            if first_victim is None:
+                first_victim = victim_content
+                if self.last_victim is None:
+                    self.last_victim = victim_content
+
+    def evict_unit(self, frame_number, release=True):
+        """
+        Mengeluarkan unit yang sudah diambil dari algoritma lewat select_victim
+        (dipakai daemon page-out). Unit dirty dihitung sebagai write-back; dengan
+        release=False frame unit dirty tetap teralokasi sampai pemanggil membebaskannya
+        setelah write-back selesai. Unit bersih selalu langsung dibebaskan.
+        Return: True jika unit dirty (perlu write-back), False jika bersih
+        """
+        dirty = self.physical_memory.is_dirty(frame_number)
+        if dirty:
+            self.stats["writebacks"] += 1
+        self._evict_frame(frame_number, notify_algorithm=False, release=release or not dirty)
+        return dirty
+
+    def _write_back_and_evict(self, frame_number, notify_algorithm=True):
+        """Mengeluarkan unit; korban dirty ditulis balik secara sinkron sebelum frame dipakai ulang"""
+        if self.physical_memory.is_dirty(frame_number):
+            self.stats["writebacks"] += 1
+            if self.swap_device:
+                self.clock = self.swap_device.write_page(self.clock, self.physical_memory.block_size(frame_number))
+        self._evict_frame(frame_number, notify_algorithm)
+
+    def _evict_region(self, frame_number, order):
+        """
+        Mengeluarkan semua unit di region sejajar 2^order yang memuat frame_number
+        agar buddy allocator dapat menggabungkannya menjadi satu blok. Frame yang
+        masih menunggu write-back daemon dibiarkan; allocator menunggu daemon.
+        """
+        span = 1 << order
+        start = frame_number - frame_number % span
+        for frame in range(start, start + span):
+            if (self.physical_memory.frames[frame] is not None and self.physical_memory.mappers[frame]
+                    and self.physical_memory.allocator.block_order(frame) is not None):
+                self._write_back_and_evict(frame)
+
+    def _evict_frame(self, frame_number, notify_algorithm=True, release=True):
+        """
+        Mengeluarkan frame dari memori fisik: semua pemetaan pada frame
+        (dari reverse map) ditandai tidak valid, lalu frame dibebaskan
+        kecuali release=False (frame masih menunggu write-back).
+        Untuk huge page, seluruh frame dalam blok diproses sekaligus.
+        """
+        for frame in range(frame_number, frame_number + self.physical_memory.block_size(frame_number)):
+            for victim_pid, victim_page_number in self.physical_memory.clear_mappings(frame):
+                victim_process = self.processes.get(victim_pid)
+                if victim_process is None:
+                    continue
+                victim_page_entry = victim_process.get_page_entry(victim_page_number)
+                if victim_page_entry:
+                    if victim_page_entry.prefetched:
+                        self.stats["prefetch_unused"] += 1
+                    victim_page_entry.valid = False
+                    victim_page_entry.frame_number = -1
+                    victim_page_entry.cow = False
+                    victim_page_entry.prefetched = False
+            self.prefetch_inflight.pop(frame, None)
+        if notify_algorithm:
+            self.replacement_algorithm.page_removed(frame_number)
+        if release:
+            self.physical_memory.free_frame(frame_number)
+
+    def _unmap_page(self, pid, page_number, page_entry):
+        """Melepas satu pemetaan; frame dibebaskan jika tidak ada pemetaan tersisa"""
+        frame_number = page_entry.frame_number
+        if page_entry.prefetched:
+            self.stats["prefetch_unused"] += 1
+        page_entry.valid = False
+        page_entry.frame_number = -1
+        page_entry.cow = False
+        page_entry.prefetched = False
+        if self.physical_memory.remove_mapping(frame_number, pid, page_number) == 0:
+            self.prefetch_inflight.pop(frame_number, None)
+            # Penting: panggil page_removed di algoritma untuk update state internalnya
+            self.replacement_algorithm.page_removed(frame_number)
+            self.physical_memory.free_frame(frame_number)
     
     def get_stats(self):
-        """Mengambil statistik performa sistem (hit ratio, jumlah hit/fault)"""
-        total = self.stats["hits"] + self.stats["faults"]
-        if total == 0:
-            return {"hits": 0, "faults": 0, "hit_ratio": 0}
-        return {
-            "hits": self.stats["hits"],
-            "faults": self.stats["faults"],
-            "hit_ratio": (self.stats["hits"] / total) * 100
-        }
+        """
+        Mengambil statistik performa sistem (hit ratio, jumlah hit/fault, COW fault, write-back)
+        Hit ratio dihitung terhadap semua akses, termasuk COW fault.
+        Jika swap device dipakai, ditambah total waktu I/O, persentil latensi page fault
+        dan total waktu tunggu halaman prefetch (prefetch_stall_ms)
+        """
+        stats = dict(self.stats)
+        total = stats["hits"] + stats["faults"] + stats["cow_faults"]
+        stats["hit_ratio"] = (stats["hits"] / total) * 100 if total else 0
+        if self.prefetcher:
+            issued = stats["prefetch_issued"]
+            useful = stats["prefetch_useful"]
+            # Akurasi: porsi prefetch yang terpakai; cakupan: porsi miss yang tertutup prefetch
+            stats["prefetch_accuracy"] = (useful / issued) * 100 if issued else 0
+            stats["prefetch_coverage"] = (useful / (useful + stats["faults"])) * 100 if useful + stats["faults"] else 0
+            stats["prefetch_pollution"] = (stats["prefetch_unused"] / issued) * 100 if issued else 0
+        if self.swap_device:
+            from core.backing_store import percentile  # Modul swap hanya dimuat bila dipakai
+            stats.update(self.swap_device.get_stats())
+            stats["sim_time_ms"] = self.clock
+            stats["prefetch_stall_ms"] = self.prefetch_stall_ms
+            stats["fault_latency_p50_ms"] = percentile(self.fault_latencies, 50)
+            stats["fault_latency_p95_ms"] = percentile(self.fault_latencies, 95)
+            stats["fault_latency_p99_ms"] = percentile(self.fault_latencies, 99)
+        if self.physical_memory.huge_page_order:
+            stats.update(self.physical_memory.get_fragmentation())
+        return stats
     
     def reset(self):
         """Reset sistem ke kondisi awal - hapus semua proses dan statistik"""
-        self.stats = {"hits": 0, "faults": 0}
+        self.stats = self._empty_stats()
+        self.clock = 0.0
+        self.fault_latencies = []
+        self.prefetch_stall_ms = 0.0
+        self.prefetch_inflight.clear()
+        if self.prefetcher:
+            self.prefetcher.reset()
         
         # Reset algoritma penggantian terlebih dahulu
         if self.replacement_algorithm:
             self.replacement_algorithm.reset()
 
+        if self.page_out_daemon:
+            self.page_out_daemon.reset()
+        if self.swap_device:
+            self.swap_device.reset()
+
         # Kemudian kosongkan memori fisik dan hapus proses
-        pids = list(self.processes.keys())
-        for pid in pids:
-            process = self.processes[pid]
-            for page_entry in process.page_table:
-                if page_entry.valid:
-                    self.physical_memory.free_frame(page_entry.frame_number)
-            del self.processes[pid]
+        self.physical_memory.reset()
+        self.processes.clear()
         self.next_pid = 0
\ No newline at end of file
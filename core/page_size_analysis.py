@@ -0,0 +1,150 @@
+# core/page_size_analysis.py
+"""
+Analisis Sensitivitas Ukuran Halaman
+Dari satu trace alamat byte, string referensi halaman untuk banyak ukuran halaman
+diturunkan sekaligus dengan geser bit tervektorisasi (NumPy), lalu kurva page fault
+FIFO/LRU dihitung untuk setiap kombinasi (ukuran halaman, jumlah frame) tanpa
+menjalankan ulang simulasi per konfigurasi.
+"""
+
+import numpy as np
+
+from core.fault_curves import fifo_faults
+
+ALGORITHMS = ("fifo", "lru")
+
+
+def page_shift(page_size):
+    """Jumlah bit offset untuk ukuran halaman (harus pangkat dua). Return: log2(page_size)"""
+    if page_size <= 0 or page_size & (page_size - 1):
+        raise ValueError(f"Ukuran halaman harus pangkat dua: {page_size}")
+    return page_size.bit_length() - 1
+
+
+def _collapse_repeats(pages):
+    """Membuang referensi yang sama dengan referensi sebelumnya (selalu hit pada FIFO dan LRU)"""
+    if len(pages) < 2:
+        return pages
+    keep = np.empty(len(pages), dtype=bool)
+    keep[0] = True
+    np.not_equal(pages[1:], pages[:-1], out=keep[1:])
+    return pages[keep]
+
+
+def lru_fault_curve(pages, max_frames):
+    """
+    Kurva page fault LRU untuk 1..max_frames frame dalam satu lintasan tervektorisasi.
+    LRU adalah algoritma stack: referensi ke-i hit dengan m frame jika stack distance-nya
+    (halaman berbeda sejak akses sebelumnya p_i, termasuk dirinya) <= m, dengan
+        distance_i = #{j < i : p_j <= p_i} - p_i    (p_j = -1 untuk akses pertama)
+    karena semua j <= p_i pasti memenuhi p_j <= p_i. Hitungan #{j < i : p_j <= p_i}
+    dikumpulkan per level merge sort bottom-up: setiap blok diurutkan menurut p_j
+    (separuh kiri didahulukan saat nilai sama), sehingga untuk elemen separuh kanan
+    jumlah elemen kiri sebelumnya dalam blok adalah hitungan untuk level tersebut.
+    Return: list, elemen ke-(m-1) adalah jumlah fault dengan m frame
+    """
+    pages = np.asarray(pages)
+    n = len(pages)
+    # Posisi akses sebelumnya untuk halaman yang sama (-1 jika akses pertama)
+    order = np.argsort(pages, kind="stable")
+    same = pages[order[1:]] == pages[order[:-1]]
+    previous = np.full(n, -1, dtype=np.int64)
+    previous[order[1:][same]] = order[:-1][same]
+
+    span = n + 2                         # Kunci (blok, p_j + 1, sisi) digabung jadi satu int64
+    shifted = previous + 1
+    dominated = np.zeros(n, dtype=np.int64)
+    perm = np.arange(n, dtype=np.int64)  # Posisi asli, terurut per blok level sebelumnya
+    level = 0
+    while (1 << level) < n:
+        keys = ((perm >> (level + 1)) * span + shifted[perm]) * 2 + ((perm >> level) & 1)
+        # Setiap blok baru terdiri dari dua run yang sudah terurut: sort stabil (timsort) tinggal menggabungkan
+        perm = perm[np.argsort(keys, kind="stable")]
+        right = ((perm >> level) & 1).astype(bool)
+        left_seen = np.cumsum(~right)
+        positions = perm[right]
+        # Kurangi elemen kiri milik blok-blok sebelumnya (masing-masing tepat 2^level)
+        dominated[positions] += left_seen[right] - ((positions >> (level + 1)) << level)
+        level += 1
+
+    reuse = previous >= 0
+    distances = dominated[reuse] - previous[reuse]
+    histogram = np.bincount(distances, minlength=max_frames + 1)[:max_frames + 1]
+    return (n - np.cumsum(histogram)[1:]).tolist()
+
+
+def decode_page_streams(addresses, page_sizes):
+    """
+    Menurunkan string referensi halaman untuk setiap ukuran halaman.
+    Alamat hanya didekode sekali untuk ukuran terkecil; ukuran berikutnya diturunkan
+    dari string halaman ukuran sebelumnya (halaman >> selisih shift) yang sudah
+    lebih pendek karena referensi berulang berurutan dibuang.
+    Return: dict ukuran halaman (terurut naik) -> NumPy array nomor halaman
+    """
+    addresses = np.asarray(addresses)
+    if addresses.size and int(addresses.min()) < 0:
+        raise ValueError("Alamat virtual tidak boleh negatif.")
+    streams = {}
+    pages = addresses.astype(np.int64, copy=False)
+    previous_shift = 0
+    for page_size in sorted(set(page_sizes)):
+        shift = page_shift(page_size)
+        pages = _collapse_repeats(pages >> (shift - previous_shift))
+        previous_shift = shift
+        streams[page_size] = pages
+    return streams
+
+
+def page_size_sweep(addresses, page_sizes, frame_counts, algorithms=ALGORITHMS):
+    """
+    Jumlah page fault untuk setiap kombinasi ukuran halaman x jumlah frame x algoritma.
+    LRU memakai satu kurva stack distance per ukuran halaman; FIFO (bukan algoritma stack)
+    dihitung per jumlah frame, kecuali frame >= halaman unik yang hanya berisi compulsory miss.
+    Return: list baris dict page_size, frames, memory_bytes, algorithm, references,
+    unique_pages, faults, fault_rate (%)
+    """
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Algoritma tidak dikenal: {algorithm}. Pilihan: {', '.join(ALGORITHMS)}")
+    frame_counts = sorted(set(frame_counts))
+    if not frame_counts or frame_counts[0] < 1:
+        raise ValueError("Jumlah frame harus minimal 1.")
+    total = len(addresses)
+
+    rows = []
+    for page_size, pages in decode_page_streams(addresses, page_sizes).items():
+        distinct = len(np.unique(pages))
+        faults = {}
+        if "lru" in algorithms:
+            curve = lru_fault_curve(pages, frame_counts[-1])
+            faults["lru"] = [curve[m - 1] for m in frame_counts]
+        if "fifo" in algorithms:
+            references = pages.tolist()
+            faults["fifo"] = [fifo_faults(references, m) if m < distinct else distinct for m in frame_counts]
+        for algorithm in algorithms:
+            for num_frames, fault_count in zip(frame_counts, faults[algorithm]):
+                rows.append({
+                    "page_size": page_size,
+                    "frames": num_frames,
+                    "memory_bytes": page_size * num_frames,
+                    "algorithm": algorithm,
+                    "references": total,
+                    "unique_pages": distinct,
+                    "faults": fault_count,
+                    "fault_rate": (fault_count / total) * 100 if total else 0,
+                })
+    return rows
+
+
+def heatmap(rows, algorithm="fifo", value="fault_rate"):
+    """
+    Menyusun hasil page_size_sweep menjadi matriks untuk heatmap
+    Return: (list ukuran halaman, list jumlah frame, array [ukuran halaman][frame])
+    """
+    rows = [row for row in rows if row["algorithm"] == algorithm]
+    page_sizes = sorted({row["page_size"] for row in rows})
+    frame_counts = sorted({row["frames"] for row in rows})
+    matrix = np.full((len(page_sizes), len(frame_counts)), np.nan)
+    for row in rows:
+        matrix[page_sizes.index(row["page_size"]), frame_counts.index(row["frames"])] = row[value]
+    return page_sizes, frame_counts, matrix
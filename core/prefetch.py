@@ -0,0 +1,120 @@
+# core/prefetch.py
+"""
+Implementasi Prefetcher (Readahead) pada jalur page fault
+Menyediakan tiga strategi: readahead sekuensial adaptif, deteksi stride, dan cluster paging
+"""
+from abc import ABC, abstractmethod
+
+class Prefetcher(ABC):
+    """
+    Kelas abstrak untuk semua prefetcher.
+    MMU memanggil on_fault setiap page fault dan on_prefetch_hit saat halaman
+    hasil prefetch pertama kali diakses. Keduanya mengembalikan daftar nomor
+    halaman kandidat; MMU yang memfilter halaman di luar batas atau sudah resident.
+    """
+    def __init__(self):
+        self.state = {}  # State per proses: pid -> dict
+
+    @abstractmethod
+    def on_fault(self, pid, page_number):
+        """Dipanggil ketika terjadi page fault. Return: daftar halaman untuk di-prefetch."""
+        pass
+
+    def on_prefetch_hit(self, pid, page_number):
+        """Dipanggil ketika halaman hasil prefetch diakses. Return: daftar halaman tambahan."""
+        return []
+
+    def on_prefetch_truncated(self, pid, dropped):
+        """Dipanggil ketika MMU berhenti sebelum memuat semua kandidat; dropped: kandidat yang tidak dimuat."""
+        pass
+
+    def reset(self):
+        """Reset state internal prefetcher."""
+        self.state.clear()
+
+class SequentialReadahead(Prefetcher):
+    """
+    Readahead sekuensial dengan jendela adaptif (mirip readahead Linux).
+    Jendela berlipat ganda selama akses tetap sekuensial dan kembali ke ukuran
+    awal saat pola terputus. Akses ke halaman pemicu (tengah jendela
+    terakhir) langsung menjadwalkan jendela berikutnya secara asinkron.
+    """
+    def __init__(self, initial_window=2, max_window=8):
+        super().__init__()
+        self.initial_window = initial_window
+        self.max_window = max_window
+
+    def on_fault(self, pid, page_number):
+        state = self.state.get(pid)
+        if state and page_number in (state["next"], state["last_fault"] + 1):
+            window = min(state["window"] * 2, self.max_window)
+        else:
+            window = self.initial_window
+        self.state[pid] = {
+            "last_fault": page_number,
+            "window": window,
+            "trigger": page_number + 1 + window // 2,
+            "next": page_number + 1 + window,
+        }
+        return list(range(page_number + 1, page_number + 1 + window))
+
+    def on_prefetch_hit(self, pid, page_number):
+        state = self.state.get(pid)
+        if not state or page_number != state["trigger"]:
+            return []
+        window = min(state["window"] * 2, self.max_window)
+        start = state["next"]
+        state["window"] = window
+        state["trigger"] = start + window // 2
+        state["next"] = start + window
+        return list(range(start, start + window))
+
+    def on_prefetch_truncated(self, pid, dropped):
+        # Jendela dipotong batas batch MMU: lanjutkan dari halaman pertama yang tidak dimuat
+        # agar tidak ada lubang, dan picu jendela berikutnya di halaman terakhir yang dimuat
+        state = self.state.get(pid)
+        if not state or not dropped:
+            return
+        state["next"] = dropped[0]
+        state["trigger"] = min(state["trigger"], dropped[0] - 1)
+class StridePrefetcher(Prefetcher):
+    """
+    Prefetcher berbasis stride. Jika dua fault berturut-turut memiliki selisih
+    (stride) yang sama, halaman page + k*stride untuk k = 1..degree di-prefetch.
+    Setiap hit pada halaman prefetch menambah satu halaman agar tetap degree langkah di depan.
+    """
+    def __init__(self, degree=4):
+        super().__init__()
+        self.degree = degree
+
+    def on_fault(self, pid, page_number):
+        state = self.state.setdefault(pid, {"last": None, "stride": 0, "confident": False})
+        if state["last"] is not None:
+            stride = page_number - state["last"]
+            state["confident"] = stride != 0 and stride == state["stride"]
+            state["stride"] = stride
+        state["last"] = page_number
+        if not state["confident"]:
+            return []
+        stride = state["stride"]
+        return [page_number + stride * k for k in range(1, self.degree + 1)]
+
+    def on_prefetch_hit(self, pid, page_number):
+        state = self.state.get(pid)
+        if not state or not state["confident"]:
+            return []
+        state["last"] = page_number
+        return [page_number + state["stride"] * self.degree]
+
+class ClusterPrefetcher(Prefetcher):
+    """
+    Cluster paging: saat fault, seluruh cluster halaman yang sejajar
+    (cluster_size halaman) di sekitar halaman yang diminta ikut dimuat.
+    """
+    def __init__(self, cluster_size=8):
+        super().__init__()
+        self.cluster_size = cluster_size
+
+    def on_fault(self, pid, page_number):
+        start = page_number - page_number % self.cluster_size
+        return [p for p in range(start, start + self.cluster_size) if p != page_number]
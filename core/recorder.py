@@ -0,0 +1,208 @@
+# core/recorder.py
+"""
+Perekam Jalannya Simulasi (format kolumnar)
+Setiap akses dicatat sebagai kolom biner (pid, page, outcome, frame, victim_pid, victim),
+setiap perubahan isi frame dicatat sebagai delta, dan seluruh isi memori fisik
+disimpan sebagai keyframe berkala. State pada langkah mana pun dibangun ulang
+dari keyframe terdekat ditambah delta sesudahnya (RecordedRun.state_at).
+
+Perekam hanya memakai modul standar; pembaca (RecordedRun) memakai NumPy memmap.
+"""
+
+import json
+import os
+import sys
+from array import array
+
+# Kode outcome untuk kolom "outcome" (status dari MMU.access_page)
+OUTCOMES = {"hit": 0, "fault_free": 1, "fault_replace": 2, "cow_fault": 3}
+OUTCOME_ERROR = -1
+OUTCOME_NAMES = {code: name for name, code in OUTCOMES.items()}
+
+# Nama kolom -> typecode array (stdlib) dan dtype NumPy yang setara
+ACCESS_COLUMNS = {"pid": ("i", "i4"), "page": ("i", "i4"), "outcome": ("b", "i1"), "frame": ("i", "i4"), "victim_pid": ("i", "i4"), "victim": ("i", "i4")}
+DELTA_COLUMNS = {"delta_step": ("q", "i8"), "delta_frame": ("i", "i4"), "delta_pid": ("i", "i4"), "delta_page": ("i", "i4")}
+KEYFRAME_COLUMNS = {"key_step": ("q", "i8"), "key_hits": ("q", "i8"), "key_faults": ("q", "i8"), "key_cow_faults": ("q", "i8"), "key_frames": ("i", "i4")}
+
+
+class RunRecorder:
+    """
+    Merekam jalannya simulasi ke direktori path. Dipasang lewat
+    MemoryManagementUnit.attach_recorder(recorder) dan ditutup dengan close().
+    Kolom ditampung di buffer lalu ditambahkan ke file setiap flush_size baris.
+    """
+    def __init__(self, path, keyframe_interval=65536, flush_size=65536):
+        self.path = path
+        self.keyframe_interval = keyframe_interval
+        self.flush_size = flush_size
+        self.num_frames = 0
+        self.steps = 0           # Jumlah akses yang sudah direkam
+        self.hits = 0
+        self.faults = 0
+        self.cow_faults = 0
+        self.physical_memory = None
+        self.buffers = {name: array(code) for name, (code, _) in {**ACCESS_COLUMNS, **DELTA_COLUMNS, **KEYFRAME_COLUMNS}.items()}
+        self._prepare_directory()
+        for name in self.buffers:
+            open(self._column_path(name), "wb").close()
+
+    def _prepare_directory(self):
+        """
+        Direktori rekaman harus kosong atau hanya berisi rekaman lama (ditimpa).
+        meta.json lama dihapus lebih dulu agar rekaman yang terputus tidak
+        terbaca sebagai rekaman lengkap. ValueError jika ada file lain.
+        """
+        os.makedirs(self.path, exist_ok=True)
+        own_files = {f"{name}.bin" for name in self.buffers} | {"meta.json"}
+        foreign = sorted(set(os.listdir(self.path)) - own_files)
+        if foreign:
+            raise ValueError(f"Direktori rekaman {self.path} tidak kosong (berisi {', '.join(foreign[:3])}).")
+        meta_path = os.path.join(self.path, "meta.json")
+        if os.path.exists(meta_path):
+            os.remove(meta_path)
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f"{name}.bin")
+
+    def start(self, physical_memory):
+        """Mulai merekam: simpan keyframe awal (state sebelum langkah 0)"""
+        self.physical_memory = physical_memory
+        self.num_frames = physical_memory.num_frames
+        self._keyframe(-1)
+
+    def frame_changed(self, frame_number, content):
+        """Dipanggil PhysicalMemory setiap isi frame berubah; berlaku mulai langkah saat ini"""
+        pid, page_number = content if content else (-1, -1)
+        self.buffers["delta_step"].append(self.steps)
+        self.buffers["delta_frame"].append(frame_number)
+        self.buffers["delta_pid"].append(pid)
+        self.buffers["delta_page"].append(page_number)
+
+    def record_access(self, pid, page_number, status, frame_number, victim):
+        """Mencatat satu akses. victim: (pid, halaman) korban atau None"""
+        outcome = OUTCOMES.get(status, OUTCOME_ERROR)
+        self.buffers["pid"].append(pid)
+        self.buffers["page"].append(page_number)
+        self.buffers["outcome"].append(outcome)
+        self.buffers["frame"].append(frame_number)
+        self.buffers["victim_pid"].append(victim[0] if victim else -1)
+        self.buffers["victim"].append(victim[1] if victim else -1)
+        if outcome == OUTCOMES["hit"]:
+            self.hits += 1
+        elif outcome == OUTCOMES["cow_fault"]:
+            self.cow_faults += 1
+        elif outcome != OUTCOME_ERROR:
+            self.faults += 1
+
+        if (self.steps + 1) % self.keyframe_interval == 0:
+            self._keyframe(self.steps)
+        self.steps += 1
+        if len(self.buffers["pid"]) >= self.flush_size:
+            self.flush()
+
+    def _keyframe(self, step):
+        """Snapshot seluruh frame (pid, halaman) setelah langkah step"""
+        self.buffers["key_step"].append(step)
+        self.buffers["key_hits"].append(self.hits)
+        self.buffers["key_faults"].append(self.faults)
+        self.buffers["key_cow_faults"].append(self.cow_faults)
+        frames = self.buffers["key_frames"]
+        for content in self.physical_memory.frames:
+            frames.extend(content if content else (-1, -1))
+
+    def flush(self):
+        """Menambahkan isi buffer ke file kolom"""
+        for name, buffer in self.buffers.items():
+            if buffer:
+                with open(self._column_path(name), "ab") as f:
+                    buffer.tofile(f)
+                del buffer[:]
+
+    def close(self):
+        """Flush terakhir dan tulis metadata rekaman"""
+        self.flush()
+        meta = {
+            "steps": self.steps,
+            "num_frames": self.num_frames,
+            "keyframe_interval": self.keyframe_interval,
+            "byteorder": sys.byteorder,
+            "columns": {name: dtype for name, (_, dtype) in {**ACCESS_COLUMNS, **DELTA_COLUMNS, **KEYFRAME_COLUMNS}.items()},
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+
+class RecordedRun:
+    """
+    Pembaca rekaman. Kolom dibuka sebagai NumPy memmap sehingga rekaman besar
+    tidak perlu dimuat ke memori. state_at(step) membangun ulang isi memori fisik
+    setelah langkah step dari keyframe terdekat + delta (paling banyak satu interval).
+    """
+    def __init__(self, path):
+        import numpy as np
+        self._np = np
+        with open(os.path.join(path, "meta.json")) as f:
+            self.meta = json.load(f)
+        prefix = "<" if self.meta["byteorder"] == "little" else ">"
+        self.columns = {}
+        for name, dtype in self.meta["columns"].items():
+            column_path = os.path.join(path, f"{name}.bin")
+            if os.path.getsize(column_path) == 0:
+                self.columns[name] = np.zeros(0, dtype=prefix + dtype)
+            else:
+                self.columns[name] = np.memmap(column_path, dtype=prefix + dtype, mode="r")
+        self.num_frames = self.meta["num_frames"]
+        self.key_frames = self.columns["key_frames"].reshape(-1, self.num_frames, 2)
+
+    def __len__(self):
+        return self.meta["steps"]
+
+    def access(self, step):
+        """Data akses pada langkah step: dict pid, page, outcome, frame, victim_pid, victim (halaman korban)"""
+        outcome = int(self.columns["outcome"][step])
+        return {
+            "pid": int(self.columns["pid"][step]),
+            "page": int(self.columns["page"][step]),
+            "outcome": OUTCOME_NAMES.get(outcome, "error"),
+            "frame": int(self.columns["frame"][step]),
+            "victim_pid": int(self.columns["victim_pid"][step]),
+            "victim": int(self.columns["victim"][step]),
+        }
+
+    def state_at(self, step):
+        """
+        Isi memori fisik dan statistik kumulatif setelah langkah step (0-based).
+        Return: dict step, frames (list (pid, halaman) atau None), hits, faults, cow_faults, access
+        """
+        np = self._np
+        step = max(0, min(step, len(self) - 1))
+        key_steps = self.columns["key_step"]
+        key_index = int(np.searchsorted(key_steps, step, side="right")) - 1
+        key_step = int(key_steps[key_index])
+        frames = np.array(self.key_frames[key_index])
+
+        # Delta setelah keyframe sampai langkah step; jika frame berubah berkali-kali, ambil yang terakhir
+        delta_steps = self.columns["delta_step"]
+        lo = int(np.searchsorted(delta_steps, key_step, side="right"))
+        hi = int(np.searchsorted(delta_steps, step, side="right"))
+        if hi > lo:
+            delta_frames = np.asarray(self.columns["delta_frame"][lo:hi])
+            _, last = np.unique(delta_frames[::-1], return_index=True)
+            pick = lo + (hi - lo - 1 - last)
+            frames[self.columns["delta_frame"][pick], 0] = self.columns["delta_pid"][pick]
+            frames[self.columns["delta_frame"][pick], 1] = self.columns["delta_page"][pick]
+
+        # Statistik kumulatif: nilai di keyframe + hitungan outcome sesudahnya
+        window = np.asarray(self.columns["outcome"][key_step + 1:step + 1])
+        hits = int(self.columns["key_hits"][key_index]) + int(np.count_nonzero(window == OUTCOMES["hit"]))
+        faults = int(self.columns["key_faults"][key_index]) + int(np.count_nonzero((window == OUTCOMES["fault_free"]) | (window == OUTCOMES["fault_replace"])))
+        cow_faults = int(self.columns["key_cow_faults"][key_index]) + int(np.count_nonzero(window == OUTCOMES["cow_fault"]))
+
+        return {
+            "step": step,
+            "frames": [(int(pid), int(page)) if pid >= 0 else None for pid, page in frames.tolist()],
+            "hits": hits,
+            "faults": faults,
+            "cow_faults": cow_faults,
+            "access": self.access(step),
+        }
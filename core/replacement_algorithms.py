@@ -7,10 +7,15 @@ from abc import ABC, abstractmethod
 from collections import deque
 
 class ReplacementAlgorithm(ABC):
-    """Kelas abstrak untuk semua algoritma penggantian halaman."""
+    """
+    Kelas abstrak untuk semua algoritma penggantian halaman.
+    Unit penggantian diidentifikasi oleh frame pertamanya; huge page adalah
+    satu unit berukuran size frame sehingga dikeluarkan sekaligus.
+    """
     def __init__(self, frames_limit):
         self.frames_limit = frames_limit
         self.frame_to_page = {}
+        self.frame_to_size = {}
         self.loaded_frames = set()
 
     def page_accessed(self, frame_number, page_number):
@@ -18,25 +23,46 @@ class ReplacementAlgorithm(ABC):
         pass
 
     @abstractmethod
-    def page_loaded(self, frame_number, page_number):
-        """Dipanggil ketika halaman baru dimuat."""
+    def page_loaded(self, frame_number, page_number, size=1):
+        """Dipanggil ketika halaman baru (atau huge page berukuran size frame) dimuat."""
         pass
 
     @abstractmethod
-    def select_victim(self):
-        """Memilih frame korban untuk diganti."""
+    def select_victim(self, skip=None):
+        """
+        Memilih frame korban untuk diganti. Frame yang membuat skip(frame) bernilai
+        True dilewati tanpa mengubah posisinya. Return: frame korban atau -1.
+        """
         pass
     
     def page_removed(self, frame_number):
         """Dipanggil ketika halaman dihapus dari frame."""
         if frame_number in self.frame_to_page:
             del self.frame_to_page[frame_number]
+        self.frame_to_size.pop(frame_number, None)
         self.loaded_frames.discard(frame_number)
+
+    def split_unit(self, frame_number):
+        """
+        Memecah unit berukuran size frame (huge page) menjadi unit-unit satu frame.
+        Subkelas menempatkan hasil pecahan di posisi unit lama dalam urutan penggantian.
+        Return: daftar frame hasil pemecahan
+        """
+        size = self.frame_to_size.get(frame_number, 1)
+        page_number = self.frame_to_page.get(frame_number)
+        frames = list(range(frame_number, frame_number + size))
+        for offset, frame in enumerate(frames):
+            self.frame_to_size[frame] = 1
+            if page_number is not None:
+                self.frame_to_page[frame] = page_number + offset
+            self.loaded_frames.add(frame)
+        return frames
     
     @abstractmethod
     def reset(self):
         """Reset state internal algoritma."""
         self.frame_to_page.clear()
+        self.frame_to_size.clear()
         self.loaded_frames.clear()
 
 class FIFO(ReplacementAlgorithm):
@@ -45,18 +71,30 @@ class FIFO(ReplacementAlgorithm):
         super().__init__(frames_limit)
         self.queue = deque()
 
-    def page_loaded(self, frame_number, page_number):
+    def page_loaded(self, frame_number, page_number, size=1):
         if frame_number not in self.queue:
             self.queue.append(frame_number)
         self.frame_to_page[frame_number] = page_number
+        self.frame_to_size[frame_number] = size
         self.loaded_frames.add(frame_number)
 
-    def select_victim(self):
+    def select_victim(self, skip=None):
         if not self.queue:
             return -1
-        victim_frame = self.queue.popleft()
-        return victim_frame
+        if skip is None:
+            return self.queue.popleft()
+        for i, frame_number in enumerate(self.queue):
+            if not skip(frame_number):
+                del self.queue[i]
+                return frame_number
+        return -1
     
+    def split_unit(self, frame_number):
+        frames = super().split_unit(frame_number)
+        # Pecahan menempati posisi antrian unit lama sehingga umurnya tidak berubah
+        self.queue = deque(f for queued in self.queue for f in (frames if queued == frame_number else (queued,)))
+        return frames
+
     def page_removed(self, frame_number):
         super().page_removed(frame_number)
         # Hapus frame dari antrian jika ada, untuk kasus terminate process
@@ -79,19 +117,27 @@ class LRU(ReplacementAlgorithm):
             self.usage_order.remove(frame_number)
         self.usage_order.append(frame_number)
 
-    def page_loaded(self, frame_number, page_number):
+    def page_loaded(self, frame_number, page_number, size=1):
         if frame_number in self.usage_order:
             self.usage_order.remove(frame_number)
         self.usage_order.append(frame_number)
         self.frame_to_page[frame_number] = page_number
+        self.frame_to_size[frame_number] = size
         self.loaded_frames.add(frame_number)
 
-    def select_victim(self):
-        if not self.usage_order:
-            return -1
-        victim_frame = self.usage_order.pop(0)
-        return victim_frame
+    def select_victim(self, skip=None):
+        for i, frame_number in enumerate(self.usage_order):
+            if skip is None or not skip(frame_number):
+                return self.usage_order.pop(i)
+        return -1
         
+    def split_unit(self, frame_number):
+        frames = super().split_unit(frame_number)
+        if frame_number in self.usage_order:
+            index = self.usage_order.index(frame_number)
+            self.usage_order[index:index + 1] = frames
+        return frames
+
     def page_removed(self, frame_number):
         super().page_removed(frame_number)
         if frame_number in self.usage_order:
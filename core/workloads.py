@@ -0,0 +1,172 @@
+# core/workloads.py
+"""
+Generator Beban Kerja Sintetis (vektorisasi NumPy)
+Menghasilkan string referensi halaman untuk pola Zipf, uniform, scan sekuensial,
+loop, lokalitas berfase, dan pola siklis rawan Anomali Belady.
+
+Semua pola dibangkitkan per chunk: chunk ke-i memakai RNG dengan seed (seed, i)
+dan pola berbasis posisi dihitung dari indeks global referensi. Hasilnya
+reproducible dan identik antara generate() dan stream() selama chunk_size sama,
+dengan memori yang dibatasi oleh ukuran chunk.
+"""
+
+import numpy as np
+
+from core.fault_curves import BELADY_PATTERN
+
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# Pola cyclic: jumlah siklus berturut-turut yang memakai halaman berbeda sebelum pergeseran berulang
+CYCLIC_COLD_CYCLES = 16
+
+
+def _uniform(rng, start, count, params):
+    """Referensi acak seragam pada num_pages halaman"""
+    return rng.integers(0, params["num_pages"], size=count)
+
+def _zipf(rng, start, count, params):
+    """Referensi Zipf terbatas: peluang halaman peringkat k sebanding 1/k^alpha"""
+    cdf = params["_cdf"]
+    last = params["num_pages"] - 1
+    u = rng.random(count)
+    # Guide table memberi batas bawah peringkat; koreksi maju biasanya 0-1 langkah
+    ranks = params["_guide"][(u * len(params["_guide"])).astype(np.int64)]
+    pending = np.flatnonzero(cdf[ranks] <= u)
+    while pending.size:
+        ranks[pending] = np.minimum(ranks[pending] + 1, last)
+        pending = pending[(cdf[ranks[pending]] <= u[pending]) & (ranks[pending] < last)]
+    return params["_rank_to_page"][ranks]
+
+def _sequential(rng, start, count, params):
+    """Scan sekuensial berulang dari start_page melewati seluruh ruang alamat"""
+    idx = np.arange(start, start + count, dtype=np.int64)
+    return (params.get("start_page", 0) + idx) % params["num_pages"]
+
+def _loop(rng, start, count, params):
+    """Loop berulang atas loop_pages halaman, dengan peluang noise ke halaman acak"""
+    idx = np.arange(start, start + count, dtype=np.int64)
+    pages = params.get("base_page", 0) + idx % params["loop_pages"]
+    noise = params.get("noise", 0.0)
+    if noise > 0:
+        mask = rng.random(count) < noise
+        pages[mask] = rng.integers(0, params["num_pages"], size=int(mask.sum()))
+    return pages
+
+def _phased(rng, start, count, params):
+    """
+    Lokalitas berfase: setiap phase_length referensi, working set sebesar
+    working_set halaman berpindah ke lokasi lain dalam ruang alamat
+    """
+    num_pages = params["num_pages"]
+    working_set = min(params["working_set"], num_pages)
+    idx = np.arange(start, start + count, dtype=np.int64)
+    phase = idx // params["phase_length"]
+    # Offset fase deterministik dari hash multiplikatif (tidak bergantung chunk)
+    mixed = (phase * 2654435761 + params["_seed"] * 40503) % (1 << 32)
+    base = mixed % (num_pages - working_set + 1)
+    return base + rng.integers(0, working_set, size=count)
+
+def _cyclic(rng, start, count, params):
+    """
+    Pola siklis rawan Anomali Belady: pattern diulang, setiap pengulangan
+    digeser stride halaman agar tiap siklus kembali dimulai dengan memori "dingin".
+    num_pages default mencakup CYCLIC_COLD_CYCLES pergeseran sebelum kembali ke awal
+    """
+    pattern = params["_pattern"]
+    idx = np.arange(start, start + count, dtype=np.int64)
+    repetition = idx // len(pattern)
+    return (pattern[idx % len(pattern)] + repetition * params["_stride"]) % params["num_pages"]
+
+
+# Parameter wajib per pola (num_pages diperiksa terpisah karena bisa punya nilai default)
+REQUIRED_PARAMS = {
+    "loop": ("loop_pages",),
+    "phased": ("working_set", "phase_length"),
+}
+
+WORKLOADS = {
+    "uniform": _uniform,
+    "zipf": _zipf,
+    "sequential": _sequential,
+    "loop": _loop,
+    "phased": _phased,
+    "cyclic": _cyclic,
+}
+
+
+def _prepare(kind, seed, params):
+    """Validasi parameter dan prekomputasi tabel yang dipakai semua chunk"""
+    if kind not in WORKLOADS:
+        raise ValueError(f"Pola beban kerja tidak dikenal: {kind}. Pilihan: {', '.join(WORKLOADS)}")
+    params = dict(params)
+    params["_seed"] = seed
+    for name in REQUIRED_PARAMS.get(kind, ()):
+        if name not in params or params[name] <= 0:
+            raise ValueError(f"Pola {kind} membutuhkan parameter {name} (bilangan positif).")
+    if kind == "cyclic":
+        pattern = np.asarray(params.get("pattern", BELADY_PATTERN), dtype=np.int64)
+        params["_pattern"] = pattern
+        params["_stride"] = params.get("stride", len(np.unique(pattern)))
+        params.setdefault("num_pages", int(pattern.max()) + 1 + params["_stride"] * (CYCLIC_COLD_CYCLES - 1))
+    if kind == "loop":
+        params.setdefault("num_pages", params["loop_pages"])
+    if "num_pages" not in params or params["num_pages"] <= 0:
+        raise ValueError("Parameter num_pages harus bilangan positif.")
+    if kind == "zipf":
+        num_pages = params["num_pages"]
+        weights = 1.0 / np.arange(1, num_pages + 1, dtype=np.float64) ** params.get("alpha", 1.0)
+        cdf = np.cumsum(weights)
+        params["_cdf"] = cdf / cdf[-1]
+        params["_guide"] = np.minimum(
+            np.searchsorted(params["_cdf"], np.arange(num_pages) / num_pages, side="right"),
+            num_pages - 1)
+        # Halaman populer disebar acak agar tidak selalu halaman 0, 1, 2, ...
+        if params.get("shuffle", True):
+            params["_rank_to_page"] = np.random.default_rng(seed).permutation(num_pages)
+        else:
+            params["_rank_to_page"] = np.arange(num_pages)
+    return params
+
+
+def stream(kind, n, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64, **params):
+    """
+    Menghasilkan n referensi halaman sebagai iterator chunk NumPy array.
+    Memori yang dipakai sebanding chunk_size, bukan n.
+
+    Contoh: stream("zipf", 100_000_000, seed=1, num_pages=65536, alpha=1.1)
+    """
+    generator = WORKLOADS.get(kind)
+    params = _prepare(kind, seed, params)
+    for chunk_index, start in enumerate(range(0, n, chunk_size)):
+        count = min(chunk_size, n - start)
+        rng = np.random.default_rng([seed, chunk_index])
+        yield generator(rng, start, count, params).astype(dtype, copy=False)
+
+
+def generate(kind, n, seed=0, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.int64, **params):
+    """Menghasilkan n referensi halaman sekaligus sebagai satu NumPy array"""
+    out = np.empty(n, dtype=dtype)
+    position = 0
+    for chunk in stream(kind, n, seed, chunk_size, dtype, **params):
+        out[position:position + len(chunk)] = chunk
+        position += len(chunk)
+    return out
+
+
+def run_trace(mmu, pid, references, write_ratio=0.0, seed=0):
+    """
+    Menjalankan string referensi (array, iterator chunk, atau list) pada MMU
+    untuk proses pid. Dengan write_ratio > 0 sebagian akses menjadi penulisan.
+    Return: statistik MMU setelah trace selesai
+    """
+    if isinstance(references, (np.ndarray, list, tuple)):
+        references = [references]
+    rng = np.random.default_rng(seed)
+    for chunk in references:
+        pages = np.asarray(chunk).tolist()
+        writes = (rng.random(len(pages)) < write_ratio).tolist() if write_ratio > 0 else None
+        for i, page_number in enumerate(pages):
+            message, status = mmu.access_page(pid, page_number, writes[i] if writes else False)
+            if status is None:
+                raise ValueError(message)
+    return mmu.get_stats()
@@ -4,12 +4,14 @@ Aplikasi GUI untuk Simulator Memori Virtual
 Menyediakan interface pengguna untuk berinteraksi dengan sistem manajemen memori
 """
 import customtkinter as ctk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import time  # Import untuk mengukur waktu
 import tracemalloc  # Import untuk mengukur memori
+import os
 from .theme import COLORS, FONTS
 from core.memory_manager import PhysicalMemory, MemoryManagementUnit
 from core.replacement_algorithms import FIFO, LRU
+from core.recorder import RunRecorder
 
 class VirtualMemorySimulatorApp(ctk.CTk):
     def __init__(self):
@@ -81,6 +83,9 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         ctk.CTkLabel(panel, text="Kontrol Proses Aktif", font=FONTS["heading"]).grid(row=11, column=0, padx=20, pady=10, sticky="w")
         
         ctk.CTkLabel(panel, text="Alamat Virtual (byte):", font=FONTS["body"]).grid(row=12, column=0, padx=20, pady=(10, 0), sticky="w")
+        self.write_var = ctk.BooleanVar(value=False)
+        self.write_checkbox = ctk.CTkCheckBox(panel, text="Tulis", variable=self.write_var, font=FONTS["body"])
+        self.write_checkbox.grid(row=12, column=0, padx=20, pady=(10, 0), sticky="e")
         self.addr_entry = ctk.CTkEntry(panel, placeholder_text="Contoh: 8192")
         self.addr_entry.grid(row=13, column=0, padx=20, sticky="ew")
         self.access_button = ctk.CTkButton(panel, text="Akses Alamat", command=self.access_memory, state="disabled")
@@ -92,6 +97,12 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         self.run_ref_button = ctk.CTkButton(panel, text="Jalankan String Referensi", command=self.run_reference_string, state="disabled")
         self.run_ref_button.grid(row=17, column=0, padx=20, pady=5, sticky="ew")
 
+        self.record_var = ctk.BooleanVar(value=False)
+        self.record_checkbox = ctk.CTkCheckBox(panel, text="Rekam jalannya string referensi", variable=self.record_var, font=FONTS["body"])
+        self.record_checkbox.grid(row=18, column=0, padx=20, pady=5, sticky="w")
+        self.open_replay_button = ctk.CTkButton(panel, text="Buka Rekaman (Replay)", command=self.open_replay)
+        self.open_replay_button.grid(row=19, column=0, padx=20, pady=(5, 20), sticky="ew")
+
     def create_visualization_panel(self):
         panel = ctk.CTkFrame(self, fg_color="transparent")
         panel.grid(row=0, column=1, padx=10, pady=10, sticky="nswe")
@@ -147,6 +158,8 @@ class VirtualMemorySimulatorApp(ctk.CTk):
             for i, entry in enumerate(process.page_table):
                 frame_display = entry.frame_number if entry.valid else "-"
                 valid_display = "Valid" if entry.valid else "Invalid"
+                if entry.huge:
+                    valid_display += " (Huge)"
                 tags = ("valid",) if entry.valid else ("invalid",)
                 self.page_table_view.insert("", "end", values=(i, frame_display, valid_display), tags=tags)
                 
@@ -171,7 +184,7 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         self.page_table_view.tag_configure("invalid", foreground=COLORS["text_secondary"])
 
         # Update Physical Memory View
-        free_frames = len(self.physical_memory.free_frames)
+        free_frames = self.physical_memory.free_frame_count()
         total_frames = self.physical_memory.num_frames
         self.phys_mem_frame.configure(label_text=f"{total_frames - free_frames}/{total_frames} Frames Terisi")
         
@@ -181,6 +194,9 @@ class VirtualMemorySimulatorApp(ctk.CTk):
                 color_index = pid % len(COLORS["PROCESS_COLORS"])
                 color = COLORS["PROCESS_COLORS"][color_index]
                 text = f"Frame {i}\n(P{pid}, Halaman {page_num})"
+                ref_count = self.physical_memory.ref_count(i)
+                if ref_count > 1:
+                    text += f"\nDibagi {ref_count} pemetaan"
             else:
                 color = COLORS["frame_empty"]
                 text = f"Frame {i}\n(Kosong)"
@@ -195,6 +211,7 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         self.hits_label.configure(text=f"Hits: {stats['hits']}")
         self.faults_label.configure(text=f"Page Faults: {stats['faults']}")
         self.hit_ratio_label.configure(text=f"Hit Ratio: {stats['hit_ratio']:.2f}%")
+        self.cow_faults_label.configure(text=f"COW Faults: {stats['cow_faults']}")
         
         # Reset metrik kinerja jika diminta (saat simulasi baru dimulai)
         if clear_perf_metrics:
@@ -222,7 +239,9 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         self.faults_label = ctk.CTkLabel(stats_frame, text="Page Faults: 0", font=FONTS["body"])
         self.faults_label.pack(anchor="w")
         self.hit_ratio_label = ctk.CTkLabel(stats_frame, text="Hit Ratio: 0.00%", font=FONTS["body"])
-        self.hit_ratio_label.pack(anchor="w", pady=(0,10))
+        self.hit_ratio_label.pack(anchor="w")
+        self.cow_faults_label = ctk.CTkLabel(stats_frame, text="COW Faults: 0", font=FONTS["body"])
+        self.cow_faults_label.pack(anchor="w", pady=(0,10))
 
         ctk.CTkLabel(stats_frame, text="Kinerja Eksekusi", font=FONTS["body_bold"]).pack(anchor="w")
         self.exec_time_label = ctk.CTkLabel(stats_frame, text="Waktu Eksekusi: -", font=FONTS["body"])
@@ -246,6 +265,7 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         self.log_textbox.tag_config("hit", foreground=COLORS["page_hit"])
         self.log_textbox.tag_config("fault_free", foreground=COLORS["page_fault"])
         self.log_textbox.tag_config("fault_replace", foreground=COLORS["page_victim"])
+        self.log_textbox.tag_config("cow_fault", foreground=COLORS["page_fault"])
         self.log_textbox.tag_config("info", foreground=COLORS["text_secondary"])
         self.log_textbox.tag_config("error", foreground=COLORS["page_victim"])
 
@@ -324,6 +344,10 @@ class VirtualMemorySimulatorApp(ctk.CTk):
                                       hover_color=COLORS["secondary"], command=lambda p=pid: self.terminate_process(p))
             del_button.pack(side="right", padx=(5,0))
 
+            fork_button = ctk.CTkButton(proc_frame, text="Fork", width=40, fg_color=COLORS["primary"],
+                                       hover_color=COLORS["secondary"], command=lambda p=pid: self.fork_process(p))
+            fork_button.pack(side="right", padx=(5,0))
+
     def select_process(self, pid):
         if self.mmu and pid in self.mmu.processes:
             self.active_pid = pid
@@ -332,6 +356,16 @@ class VirtualMemorySimulatorApp(ctk.CTk):
             self.update_all_visuals()
         self.update_access_controls()
     
+    def fork_process(self, pid):
+        if not self.mmu: return
+        child_pid = self.mmu.fork_process(pid)
+        if child_pid == -1:
+            self._log(f"Gagal melakukan fork proses P{pid}.", "error")
+            return
+        self._log(f"Proses P{child_pid} dibuat dari fork P{pid} (copy-on-write).", "info")
+        self.update_process_list()
+        self.select_process(child_pid)
+
     def terminate_process(self, pid):
         if self.mmu and self.mmu.terminate_process(pid):
             self._log(f"Proses P{pid} dihentikan.", "info")
@@ -343,6 +377,16 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         else:
             self._log(f"Gagal menghentikan proses P{pid}.", "error")
 
+    def open_replay(self):
+        path = filedialog.askdirectory(title="Pilih folder rekaman")
+        if not path: return
+        # Import di sini agar NumPy hanya dimuat saat replay dibuka
+        from .replay import ReplayWindow
+        try:
+            ReplayWindow(self, path)
+        except (OSError, ValueError, KeyError) as e:
+            messagebox.showerror("Error", f"Rekaman tidak dapat dibuka: {e}")
+
     def update_access_controls(self):
         state = "normal" if self.active_pid != -1 else "disabled"
         self.access_button.configure(state=state)
@@ -362,8 +406,9 @@ class VirtualMemorySimulatorApp(ctk.CTk):
             messagebox.showerror("Error", "Alamat Virtual harus angka.")
             return
             
-        self._log(f"--> P{self.active_pid} akses VA: {v_addr}", "info")
-        message, status = self.mmu.access_virtual_address(self.active_pid, v_addr)
+        write = self.write_var.get()
+        self._log(f"--> P{self.active_pid} {'tulis' if write else 'akses'} VA: {v_addr}", "info")
+        message, status = self.mmu.access_virtual_address(self.active_pid, v_addr, write)
         self._log(message, status if status else "error")
         self.update_all_visuals()
 
@@ -385,30 +430,50 @@ class VirtualMemorySimulatorApp(ctk.CTk):
         
         if not self.physical_memory: return
         page_size_bytes = self.physical_memory.page_size
+
+        recorder = None
+        if self.record_var.get():
+            record_parent = filedialog.askdirectory(title="Pilih folder untuk menyimpan rekaman")
+            if record_parent:
+                # Setiap rekaman ditulis ke subfolder baru agar tidak menimpa file lain
+                record_path = os.path.join(record_parent, time.strftime("rekaman_%Y%m%d_%H%M%S"))
+                try:
+                    recorder = RunRecorder(record_path)
+                except (ValueError, OSError) as e:
+                    messagebox.showerror("Error", f"Gagal memulai rekaman: {e}")
+                    return
+                self.mmu.attach_recorder(recorder)
+                self._log(f"Merekam ke {record_path}", "info")
         
         # Mulai pengukuran
         tracemalloc.start()
         start_time = time.perf_counter()
 
-        for i, page_num in enumerate(ref_string):
-            v_addr = page_num * page_size_bytes
-            v_addr_end = v_addr + page_size_bytes - 1
-            
-            self._log(f"--> [Langkah {i+1}] Akses Hal. {page_num} (VA: {v_addr}-{v_addr_end})", "info")
-            message, status = self.mmu.access_virtual_address(self.active_pid, v_addr)
+        try:
+            for i, page_num in enumerate(ref_string):
+                v_addr = page_num * page_size_bytes
+                v_addr_end = v_addr + page_size_bytes - 1
             
-            self._log(message, status if status else "error")
-            if "Error" in message: 
-                tracemalloc.stop() # Hentikan tracing jika ada error
-                break
+                self._log(f"--> [Langkah {i+1}] Akses Hal. {page_num} (VA: {v_addr}-{v_addr_end})", "info")
+                message, status = self.mmu.access_virtual_address(self.active_pid, v_addr)
             
-            # Update GUI di setiap langkah
-            self.update_all_visuals()
-            self.update() 
-            self.after(100) # Delay kecil untuk visualisasi
+                self._log(message, status if status else "error")
+                if "Error" in message: 
+                    tracemalloc.stop() # Hentikan tracing jika ada error
+                    break
             
-        # Selesai pengukuran
-        end_time = time.perf_counter()
+                # Update GUI di setiap langkah
+                self.update_all_visuals()
+                self.update() 
+                self.after(100) # Delay kecil untuk visualisasi
+
+            # Selesai pengukuran
+            end_time = time.perf_counter()
+        finally:
+            # Rekaman selalu ditutup, juga bila simulasi gagal di tengah jalan
+            if recorder:
+                self.mmu.detach_recorder()
+                recorder.close()
         current_mem, peak_mem = tracemalloc.get_traced_memory()
         tracemalloc.stop()
 
@@ -0,0 +1,101 @@
+# gui/replay.py
+"""
+Jendela Replay Rekaman Simulasi
+Menampilkan timeline scrubber untuk melompat ke langkah mana pun dari rekaman
+(core.recorder.RecordedRun) tanpa menjalankan ulang simulasi
+"""
+import customtkinter as ctk
+from tkinter import messagebox
+from .theme import COLORS, FONTS
+from core.recorder import RecordedRun
+
+# Warna frame yang diakses pada langkah aktif, sama dengan warna log di jendela utama
+OUTCOME_COLORS = {
+    "hit": COLORS["page_hit"],
+    "fault_free": COLORS["page_fault"],
+    "fault_replace": COLORS["page_victim"],
+    "cow_fault": COLORS["page_fault"],
+}
+
+class ReplayWindow(ctk.CTkToplevel):
+    def __init__(self, master, path):
+        super().__init__(master)
+        self.run = RecordedRun(path)
+        self.title(f"Replay Rekaman - {len(self.run)} langkah")
+        self.geometry("700x800")
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(2, weight=1)
+
+        control_frame = ctk.CTkFrame(self, fg_color=COLORS["foreground"], corner_radius=10)
+        control_frame.grid(row=0, column=0, padx=10, pady=10, sticky="ew")
+        control_frame.grid_columnconfigure(0, weight=1)
+
+        last_step = max(len(self.run) - 1, 0)
+        self.step_slider = ctk.CTkSlider(control_frame, from_=0, to=max(last_step, 1), number_of_steps=max(last_step, 1), command=lambda v: self.show_step(int(v)))
+        self.step_slider.grid(row=0, column=0, columnspan=3, padx=10, pady=(10, 5), sticky="ew")
+
+        self.step_entry = ctk.CTkEntry(control_frame, placeholder_text="Langkah, contoh: 5000000")
+        self.step_entry.grid(row=1, column=0, padx=10, pady=(0, 10), sticky="ew")
+        ctk.CTkButton(control_frame, text="Lompat", width=80, command=self.jump_to_step).grid(row=1, column=1, padx=5, pady=(0, 10))
+        ctk.CTkButton(control_frame, text="<", width=30, command=lambda: self.show_step(self.current_step - 1)).grid(row=1, column=2, padx=(0, 5), pady=(0, 10), sticky="w")
+        ctk.CTkButton(control_frame, text=">", width=30, command=lambda: self.show_step(self.current_step + 1)).grid(row=1, column=2, padx=(0, 10), pady=(0, 10), sticky="e")
+
+        self.info_label = ctk.CTkLabel(self, text="", font=FONTS["body"], justify="left")
+        self.info_label.grid(row=1, column=0, padx=20, sticky="w")
+
+        self.frames_view = ctk.CTkScrollableFrame(self, label_text="Frames", label_font=FONTS["body_bold"], corner_radius=10, fg_color=COLORS["foreground"])
+        self.frames_view.grid(row=2, column=0, padx=10, pady=10, sticky="nswe")
+
+        # Widget frame dibuat sekali lalu hanya diperbarui saat langkah berubah
+        self.frame_widgets = []
+        for _ in range(self.run.num_frames):
+            frame_widget = ctk.CTkFrame(self.frames_view, fg_color=COLORS["frame_empty"], corner_radius=6)
+            label = ctk.CTkLabel(frame_widget, text="", font=FONTS["small"])
+            label.pack(expand=True, ipady=4)
+            frame_widget.pack(pady=2, padx=5, fill="x")
+            self.frame_widgets.append((frame_widget, label))
+
+        self.current_step = 0
+        if len(self.run):
+            self.show_step(0)
+
+    def jump_to_step(self):
+        try:
+            step = int(self.step_entry.get())
+        except (ValueError, TypeError):
+            messagebox.showerror("Error", "Langkah harus angka.", parent=self)
+            return
+        self.show_step(step)
+
+    def show_step(self, step):
+        if not len(self.run): return
+        state = self.run.state_at(step)
+        self.current_step = state["step"]
+        self.step_slider.set(self.current_step)
+
+        access = state["access"]
+        total = state["hits"] + state["faults"] + state["cow_faults"]
+        hit_ratio = (state["hits"] / total) * 100 if total else 0
+        victim_text = f", korban P{access['victim_pid']} halaman {access['victim']}" if access["victim"] >= 0 else ""
+        self.info_label.configure(text=(
+            f"Langkah {self.current_step + 1}/{len(self.run)}: P{access['pid']} halaman {access['page']} -> "
+            f"{access['outcome']} (Frame {access['frame']}{victim_text})\n"
+            f"Hits: {state['hits']}, Page Faults: {state['faults']}, COW Faults: {state['cow_faults']}, Hit Ratio: {hit_ratio:.2f}%"))
+
+        occupied = 0
+        for i, content in enumerate(state["frames"]):
+            frame_widget, label = self.frame_widgets[i]
+            if content:
+                occupied += 1
+                pid, page_num = content
+                color = COLORS["PROCESS_COLORS"][pid % len(COLORS["PROCESS_COLORS"])]
+                text = f"Frame {i}\n(P{pid}, Halaman {page_num})"
+            else:
+                color = COLORS["frame_empty"]
+                text = f"Frame {i}\n(Kosong)"
+            if i == access["frame"]:
+                color = OUTCOME_COLORS.get(access["outcome"], color)
+            frame_widget.configure(fg_color=color)
+            label.configure(text=text)
+        self.frames_view.configure(label_text=f"{occupied}/{self.run.num_frames} Frames Terisi")
@@ -1,7 +1,11 @@
 # main.py
-
-from gui.app import VirtualMemorySimulatorApp
+import sys
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Mode headless: python main.py run --refs ... (sama dengan python -m core)
+        from core.cli import main
+        sys.exit(main())
+    from gui.app import VirtualMemorySimulatorApp
     app = VirtualMemorySimulatorApp()
-    app.mainloop()
\ No newline at end of file
+    app.mainloop()